@@ -3,23 +3,42 @@ Refactored Flask REST API for point cloud registration.
 
 This module provides a REST API endpoint for point cloud registration.
 All code duplication has been removed - uses shared modules from cascaded_fit.
+
+Running the module serves the app with waitress (one thread per core) when it
+is installed, falling back to Flask's development server otherwise. Any WSGI
+server works, e.g. ``gunicorn -w 4 cascaded_fit.api.app:app``.
 """
 
-from flask import Flask, request, jsonify
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from flask import Flask, Response, request, jsonify
 import numpy as np
-import open3d as o3d
-from typing import Dict, Any, Tuple
+from typing import Dict, Any, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # Optional: falls back to Flask's stdlib JSON parser
+    orjson = None
+
+try:
+    import pyarrow as pa
+except ImportError:  # Optional: Arrow request bodies are rejected without it
+    pa = None
 
 from cascaded_fit.utils.logger import Logger
 from cascaded_fit.utils.config import Config
 from cascaded_fit.utils.exceptions import (
     CascadedFitError,
     PointCloudValidationError,
-    RegistrationError
+    RegistrationError,
+    RegistrationCancelledError
 )
+from cascaded_fit.io.readers import PointCloudReader
 from cascaded_fit.core.validators import PointCloudValidator
 from cascaded_fit.core.registration import RegistrationAlgorithms
 from cascaded_fit.core.metrics import MetricsCalculator
+from cascaded_fit.core.transformations import TransformationUtils
 from cascaded_fit.fitters.icp_fitter import IcpFitter, FitResult
 from cascaded_fit.fitters.fgr_fitter import FgrFitter
 
@@ -30,6 +49,9 @@ config = Config()
 # Create Flask app
 app = Flask(__name__)
 
+# Content type for binary point uploads (Arrow IPC stream format)
+ARROW_STREAM_MIMETYPE = 'application/vnd.apache.arrow.stream'
+
 
 class PointCloudAPI:
     """
@@ -44,48 +66,51 @@ class PointCloudAPI:
         api_config = config.get_api_config()
         self.rmse_threshold = api_config.rmse_threshold
         self.enable_bidirectional = api_config.enable_bidirectional
+        self.early_exit_factor = api_config.early_exit_factor
 
         # Initialize validators
-        self.validator = PointCloudValidator()
-
-        # Initialize fitters
-        self.icp_fitter = IcpFitter()
-        self.fgr_fitter = FgrFitter()
+        self.validator = PointCloudValidator.default()
+
+        # Fitters are built per thread: IcpFitter.fit keeps per-call state on
+        # the instance, and requests (and reverse passes) run concurrently
+        self._local = threading.local()
+
+        # Reverse passes are started alongside the forward pass when enabled.
+        # The server already runs a request thread per core, so the reverse
+        # pool takes half the cores rather than doubling the CPU-bound threads.
+        self._executor = None
+        if api_config.parallel_bidirectional:
+            self._executor = ThreadPoolExecutor(
+                max_workers=max(1, (os.cpu_count() or 2) // 2),
+                thread_name_prefix="reverse-registration"
+            )
 
         logger.info(
             f"API initialized with RMSE threshold: {self.rmse_threshold}, "
             f"bidirectional: {self.enable_bidirectional}"
         )
 
-    def align_cloud_sizes(
-        self,
-        source: np.ndarray,
-        target: np.ndarray
-    ) -> Tuple[np.ndarray, np.ndarray]:
-        """
-        Align point cloud sizes by truncating to minimum size.
-
-        Args:
-            source: Source point cloud (N, 3)
-            target: Target point cloud (M, 3)
-
-        Returns:
-            Tuple of (aligned_source, aligned_target) with same size
-        """
-        min_size = min(len(source), len(target))
-
-        if len(source) != len(target):
-            logger.warning(
-                f"Cloud size mismatch: source={len(source)}, "
-                f"target={len(target)}. Aligning to {min_size} points."
-            )
-
-        return source[:min_size], target[:min_size]
+    @property
+    def icp_fitter(self) -> IcpFitter:
+        """ICP fitter owned by the calling thread."""
+        fitter = getattr(self._local, 'icp_fitter', None)
+        if fitter is None:
+            fitter = self._local.icp_fitter = IcpFitter()
+        return fitter
+
+    @property
+    def fgr_fitter(self) -> FgrFitter:
+        """FGR fitter owned by the calling thread."""
+        fitter = getattr(self._local, 'fgr_fitter', None)
+        if fitter is None:
+            fitter = self._local.fgr_fitter = FgrFitter()
+        return fitter
 
     def register_with_fallback(
         self,
         source: np.ndarray,
-        target: np.ndarray
+        target: np.ndarray,
+        stop_event: Optional[threading.Event] = None
     ) -> Tuple[np.ndarray, float, float, str]:
         """
         Register point clouds using custom ICP with FGR fallback.
@@ -96,10 +121,19 @@ class PointCloudAPI:
         Args:
             source: Source point cloud (N, 3)
             target: Target point cloud (N, 3)
+            stop_event: Once set, abandons the run at the next ICP iteration
+                or between stages
 
         Returns:
             Tuple of (transformation, rmse, max_error, method_name)
+
+        Raises:
+            RegistrationError: If all methods fail
+            RegistrationCancelledError: If stop_event is set
         """
+        # One KD-Tree over the target serves every metrics call below
+        target_tree = MetricsCalculator.build_tree(target)
+
         # Method 1: Custom PCA + ICP refinement
         logger.info("Attempting custom PCA + ICP refinement")
 
@@ -111,13 +145,13 @@ class PointCloudAPI:
 
             # ICP refinement - returns (transform, iterations, error) tuple
             icp_result = RegistrationAlgorithms.icp_refinement(
-                source, target, initial_transform
+                source, target, initial_transform, stop_event=stop_event
             )
             refined_transform = icp_result[0]  # Extract transform from tuple
 
             # Compute metrics
             metrics = MetricsCalculator.compute_metrics(
-                source, target, refined_transform
+                source, target, refined_transform, tree=target_tree
             )
 
             rmse_custom = metrics['RMSE']
@@ -134,19 +168,21 @@ class PointCloudAPI:
                     "Custom ICP"
                 )
 
+        except RegistrationCancelledError:
+            raise
         except RegistrationError as e:
             logger.warning(f"Custom ICP failed: {e}")
 
+        if stop_event is not None and stop_event.is_set():
+            raise RegistrationCancelledError("Registration cancelled")
+
         # Method 2: FGR + ICP fallback
         logger.info("Falling back to FGR + ICP pipeline")
 
         try:
             # Convert numpy arrays to Open3D point clouds for FGR/ICP fitters
-            source_cloud = o3d.geometry.PointCloud()
-            source_cloud.points = o3d.utility.Vector3dVector(source)
-            
-            target_cloud = o3d.geometry.PointCloud()
-            target_cloud.points = o3d.utility.Vector3dVector(target)
+            source_cloud = PointCloudReader.cloud_from_array(source)
+            target_cloud = PointCloudReader.cloud_from_array(target)
             
             # Try FGR first
             fgr_result = self.fgr_fitter.fit(source_cloud, target_cloud)
@@ -154,7 +190,7 @@ class PointCloudAPI:
             if fgr_result.is_success:
                 logger.info("FGR registration succeeded")
                 metrics = MetricsCalculator.compute_metrics(
-                    source, target, fgr_result.transformation
+                    source, target, fgr_result.transformation, tree=target_tree
                 )
                 return (
                     fgr_result.transformation,
@@ -163,13 +199,16 @@ class PointCloudAPI:
                     "FGR"
                 )
 
+            if stop_event is not None and stop_event.is_set():
+                raise RegistrationCancelledError("Registration cancelled")
+
             # Try ICP as last resort
             icp_result = self.icp_fitter.fit(source_cloud, target_cloud)
 
             if icp_result.is_success:
                 logger.info("ICP registration succeeded")
                 metrics = MetricsCalculator.compute_metrics(
-                    source, target, icp_result.transformation
+                    source, target, icp_result.transformation, tree=target_tree
                 )
                 return (
                     icp_result.transformation,
@@ -182,7 +221,7 @@ class PointCloudAPI:
             logger.warning("All registration methods failed")
             identity = np.eye(4)
             metrics = MetricsCalculator.compute_metrics(
-                source, target, identity
+                source, target, identity, tree=target_tree
             )
             return (
                 identity,
@@ -191,6 +230,8 @@ class PointCloudAPI:
                 "Failed (Identity)"
             )
 
+        except RegistrationCancelledError:
+            raise
         except Exception as e:
             logger.error(f"Fallback registration failed: {e}")
             raise RegistrationError(f"All registration methods failed: {e}")
@@ -220,35 +261,58 @@ class PointCloudAPI:
         # Validate inputs
         self.validator.validate_pair(source_points, target_points)
 
-        # Align cloud sizes
-        source_aligned, target_aligned = self.align_cloud_sizes(
-            source_points, target_points
-        )
+        # Clouds are registered at full size: nearest-neighbour matching does
+        # not need equal counts, and truncating would discard real points
+
+        # Start the reverse pass now so it overlaps the forward pass; it is
+        # stopped if the forward result makes it unnecessary
+        reverse_future = None
+        reverse_stop = threading.Event()
+        if self.enable_bidirectional and self._executor is not None:
+            reverse_future = self._executor.submit(
+                self.register_with_fallback, target_points, source_points, reverse_stop
+            )
 
         # Forward registration
         logger.info("Starting forward registration (source -> target)")
-        (
-            transform_fwd,
-            rmse_fwd,
-            max_error_fwd,
-            method_fwd
-        ) = self.register_with_fallback(source_aligned, target_aligned)
+        try:
+            (
+                transform_fwd,
+                rmse_fwd,
+                max_error_fwd,
+                method_fwd
+            ) = self.register_with_fallback(source_points, target_points)
+        except BaseException:
+            # Nobody will collect the reverse result; stop it freeing its worker
+            reverse_stop.set()
+            raise
 
         best_transform = transform_fwd
         best_rmse = rmse_fwd
         best_max_error = max_error_fwd
         best_method = f"Forward {method_fwd}"
 
-        # Reverse registration (if enabled)
-        if self.enable_bidirectional:
+        # Reverse registration (if enabled and forward did not already clearly pass)
+        if self.enable_bidirectional and rmse_fwd <= self.rmse_threshold * self.early_exit_factor:
+            logger.info(
+                f"Forward RMSE {rmse_fwd:.6f} well below threshold, "
+                f"skipping reverse registration"
+            )
+            # A started future cannot be cancelled; the flag stops the run
+            reverse_stop.set()
+        elif self.enable_bidirectional:
             logger.info("Starting reverse registration (target -> source)")
             try:
+                if reverse_future is not None:
+                    reverse_result = reverse_future.result()
+                else:
+                    reverse_result = self.register_with_fallback(target_points, source_points)
                 (
                     transform_rev,
                     rmse_rev,
                     max_error_rev,
                     method_rev
-                ) = self.register_with_fallback(target_aligned, source_aligned)
+                ) = reverse_result
 
                 # Choose best result
                 if rmse_rev < rmse_fwd:
@@ -257,7 +321,7 @@ class PointCloudAPI:
                         f"{rmse_rev:.6f} < {rmse_fwd:.6f}"
                     )
                     # Invert transformation for reverse
-                    best_transform = np.linalg.inv(transform_rev)
+                    best_transform = TransformationUtils.invert_rigid(transform_rev)
                     best_rmse = rmse_rev
                     best_max_error = max_error_rev
                     best_method = f"Reverse {method_rev}"
@@ -292,10 +356,78 @@ class PointCloudAPI:
         }
 
 
-# Initialize API handler
+# Module-level handler: fitters and config are built once, not per request
 api_handler = PointCloudAPI()
 
 
+def _parse_request_json() -> Any:
+    """
+    Parse the JSON request body.
+
+    Uses orjson when installed, which parses large point arrays several
+    times faster than the stdlib parser behind request.get_json().
+
+    Returns:
+        Parsed JSON data, or None if the body is empty
+    """
+    if orjson is None:
+        return request.get_json()
+
+    body = request.get_data()
+    if not body:
+        return None
+    return orjson.loads(body)
+
+
+def _parse_request_arrow() -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Parse an Arrow IPC stream request body into point arrays.
+
+    The stream carries two fixed_size_list<float32, 3> columns,
+    ``source_points`` and ``target_points``. Because a record batch has a
+    single length, the shorter cloud is padded with trailing nulls.
+
+    Returns:
+        Tuple of (source_points, target_points) as (N, 3) float64 arrays
+
+    Raises:
+        PointCloudValidationError: If the stream is malformed, a required
+            column is missing or not a list of 3 values, or a column has
+            nulls before its last point
+    """
+    try:
+        table = pa.ipc.open_stream(request.get_data()).read_all()
+    except pa.ArrowException as e:
+        raise PointCloudValidationError(f"Invalid Arrow stream: {e}") from e
+
+    missing = [name for name in ('source_points', 'target_points')
+               if name not in table.schema.names]
+    if missing:
+        raise PointCloudValidationError(
+            f"Arrow stream missing required columns: {', '.join(missing)}"
+        )
+
+    clouds = []
+    for name in ('source_points', 'target_points'):
+        column = table.column(name).combine_chunks()
+        if not (pa.types.is_fixed_size_list(column.type) and column.type.list_size == 3):
+            raise PointCloudValidationError(
+                f"Arrow column {name} must be fixed_size_list<float, 3>, got {column.type}"
+            )
+
+        # Only the padding at the end may be null; a null inside the cloud
+        # is a missing point, not padding
+        column = column.slice(0, len(column) - column.null_count)
+        if column.null_count:
+            raise PointCloudValidationError(f"Arrow column {name} has null points")
+
+        values = column.flatten().to_numpy(zero_copy_only=False)
+        # float32 on the wire; registration and metrics run in float64
+        clouds.append(values.astype(np.float64).reshape(-1, 3))
+
+    return clouds[0], clouds[1]
+
+
 @app.route('/process_point_clouds', methods=['POST'])
 def process_point_clouds_endpoint():
     """
@@ -307,6 +439,10 @@ def process_point_clouds_endpoint():
         "target_points": [[x1, y1, z1], [x2, y2, z2], ...]
     }
 
+    Point clouds may also be sent as an Arrow IPC stream with content type
+    application/vnd.apache.arrow.stream (see _parse_request_arrow), which
+    avoids parsing millions of floats from text.
+
     Response JSON format:
     {
         "transformation": [[4x4 matrix]],
@@ -320,27 +456,35 @@ def process_point_clouds_endpoint():
         JSON response with registration results or error
     """
     try:
-        # Parse request
-        data = request.get_json()
-
-        if not data:
-            logger.error("No JSON data in request")
-            return jsonify({'error': 'No JSON data provided'}), 400
-
-        if 'source_points' not in data or 'target_points' not in data:
-            logger.error("Missing required fields in request")
-            return jsonify({
-                'error': 'Missing required fields: source_points, target_points'
-            }), 400
-
-        # Convert to numpy arrays
-        source_points = np.array(data['source_points'])
-        target_points = np.array(data['target_points'])
+        if request.mimetype == ARROW_STREAM_MIMETYPE:
+            if pa is None:
+                logger.error("Arrow request received but pyarrow is not installed")
+                return jsonify({'error': 'Arrow requests require pyarrow'}), 415
+
+            source_points, target_points = _parse_request_arrow()
+        else:
+            # Parse request
+            data = _parse_request_json()
+
+            if not data:
+                logger.error("No JSON data in request")
+                return jsonify({'error': 'No JSON data provided'}), 400
+
+            if 'source_points' not in data or 'target_points' not in data:
+                logger.error("Missing required fields in request")
+                return jsonify({
+                    'error': 'Missing required fields: source_points, target_points'
+                }), 400
+
+            # Convert to contiguous float64 arrays; registration and metrics
+            # run at the precision of their input
+            source_points = np.ascontiguousarray(data['source_points'], dtype=np.float64)
+            target_points = np.ascontiguousarray(data['target_points'], dtype=np.float64)
 
         # Process registration
         result = api_handler.process_point_clouds(source_points, target_points)
 
-        return jsonify(result)
+        return _json_response(result)
 
     except PointCloudValidationError as e:
         logger.error(f"Validation error: {e}")
@@ -359,6 +503,21 @@ def process_point_clouds_endpoint():
         return jsonify({'error': f'Internal server error: {str(e)}'}), 500
 
 
+def _json_response(payload: Dict[str, Any]) -> Response:
+    """
+    Serialize a JSON response body, using orjson when available.
+
+    Args:
+        payload: JSON-serializable response data
+
+    Returns:
+        Flask response with application/json mimetype
+    """
+    if orjson is None:
+        return jsonify(payload)
+    return Response(orjson.dumps(payload), mimetype='application/json')
+
+
 @app.route('/health', methods=['GET'])
 def health_check():
     """Health check endpoint."""
@@ -397,9 +556,23 @@ if __name__ == '__main__':
         f"debug={api_config.debug}"
     )
 
-    # Run Flask app
-    app.run(
-        debug=api_config.debug,
-        host=api_config.host,
-        port=api_config.port
-    )
+    try:
+        import waitress
+    except ImportError:
+        waitress = None
+
+    if waitress is None or api_config.debug:
+        # Development server: single process, handy for debugging
+        app.run(
+            debug=api_config.debug,
+            host=api_config.host,
+            port=api_config.port
+        )
+    else:
+        # Registration is CPU-bound; serve concurrent requests across cores
+        waitress.serve(
+            app,
+            host=api_config.host,
+            port=api_config.port,
+            threads=os.cpu_count() or 4
+        )
@@ -6,16 +6,18 @@ with comprehensive options, logging, and output formatting.
 """
 
 import argparse
+import io
 import sys
 import json
 from pathlib import Path
 from typing import Optional
 
+import numpy as np
+
 from cascaded_fit.utils.logger import Logger
 from cascaded_fit.utils.config import Config
 from cascaded_fit.utils.exceptions import CascadedFitError
 from cascaded_fit.fitters.cascaded_fitter import CascadedFitter
-from cascaded_fit.io.readers import PointCloudReader
 from cascaded_fit.core.transformations import TransformationUtils
 
 # Initialize logger
@@ -319,9 +321,11 @@ Examples:
 
             if result.get('transformation') is not None:
                 lines.append("\nTransformation Matrix:")
-                transform = result['transformation']
-                for row in transform:
-                    lines.append("  " + " ".join(f"{x:12.8f}" for x in row))
+                transform = np.asarray(result['transformation'])
+                # Format the whole matrix in one pass rather than per element
+                buffer = io.StringIO()
+                np.savetxt(buffer, transform, fmt='%12.8f', delimiter=' ', newline='\n  ')
+                lines.append("  " + buffer.getvalue().rstrip())
 
             lines.append("=" * 60 + "\n")
 
@@ -0,0 +1,139 @@
+"""Nearest-neighbour search over a fixed target cloud."""
+
+import numpy as np
+from scipy.spatial import cKDTree
+from typing import Tuple
+from cascaded_fit.utils.logger import Logger
+from cascaded_fit.utils.exceptions import ConfigurationError
+
+try:
+    from pykdtree.kdtree import KDTree as PyKDTree
+except ImportError:  # Optional: the 'pykdtree' backend falls back to cKDTree
+    PyKDTree = None
+
+logger = Logger.get(__name__)
+
+NN_BACKENDS = ('cpu', 'cuda', 'auto', 'pykdtree')
+
+
+def build_kdtree(points: np.ndarray) -> cKDTree:
+    """
+    Build a cKDTree tuned for 1-nearest-neighbour queries on 3D points.
+
+    Sliding-midpoint splits (no median balancing) and uncompacted nodes
+    build much faster and cost nothing at k=1; larger leaves scan better.
+
+    Args:
+        points: Point cloud (Nx3)
+
+    Returns:
+        cKDTree over the points
+    """
+    return cKDTree(points, leafsize=32, balanced_tree=False, compact_nodes=False)
+
+
+def _cuda_available() -> bool:
+    """Return True if Open3D was built with CUDA and a device is present."""
+    try:
+        import open3d as o3d
+        return bool(o3d.core.cuda.is_available())
+    except (ImportError, AttributeError):
+        return False
+
+
+class NearestNeighborIndex:
+    """
+    1-nearest-neighbour index built once over a target cloud.
+
+    The 'cpu' backend is a SciPy cKDTree. The 'cuda' backend keeps the target
+    resident on the GPU and answers each query with Open3D's batched KNN
+    search; it falls back to the CPU tree when CUDA is unavailable. 'auto'
+    picks CUDA when present. 'pykdtree' uses pykdtree's OpenMP-parallel
+    KD-Tree for batched queries, falling back to the CPU tree when the
+    package is not installed.
+    """
+
+    def __init__(self, target: np.ndarray, backend: str = 'cpu') -> None:
+        """
+        Build the index.
+
+        Args:
+            target: Target point cloud (Mx3)
+            backend: One of 'cpu', 'cuda', 'auto' or 'pykdtree'
+
+        Raises:
+            ConfigurationError: If backend is not recognised
+        """
+        if backend not in NN_BACKENDS:
+            raise ConfigurationError(
+                f"Unknown nearest-neighbour backend '{backend}', expected one of {NN_BACKENDS}"
+            )
+
+        use_cuda = backend in ('cuda', 'auto') and _cuda_available()
+        if backend == 'cuda' and not use_cuda:
+            logger.warning("CUDA nearest-neighbour backend unavailable, using CPU KD-Tree")
+        use_pykdtree = backend == 'pykdtree' and PyKDTree is not None
+        if backend == 'pykdtree' and not use_pykdtree:
+            logger.warning("pykdtree is not installed, using CPU KD-Tree")
+
+        self._size = len(target)
+        self._dtype = np.float32 if target.dtype == np.float32 else np.float64
+
+        if use_cuda:
+            import open3d.core as o3c
+
+            self.backend = 'cuda'
+            self._device = o3c.Device('CUDA:0')
+            dataset = o3c.Tensor.from_numpy(np.ascontiguousarray(target, dtype=self._dtype))
+            self._nns = o3c.nns.NearestNeighborSearch(dataset.to(self._device))
+            self._nns.knn_index()
+        elif use_pykdtree:
+            self.backend = 'pykdtree'
+            # pykdtree queries must match the dtype of the indexed points
+            self._tree = PyKDTree(np.ascontiguousarray(target, dtype=self._dtype))
+        else:
+            self.backend = 'cpu'
+            self._tree = build_kdtree(target)
+
+        logger.debug(f"Built {self.backend} nearest-neighbour index over {len(target)} points")
+
+    def query(self, points: np.ndarray,
+              distance_upper_bound: float = np.inf) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Find the nearest target point for every query point.
+
+        Args:
+            points: Query points (Nx3)
+            distance_upper_bound: Ignore neighbours farther than this; the CPU
+                tree prunes its search with it
+
+        Returns:
+            Tuple of (distances, indices), each of length N. Points with no
+            neighbour within the bound get distance inf and index equal to
+            the number of target points.
+        """
+        if self.backend == 'cpu':
+            # workers=-1 splits the batch across all cores (GIL released)
+            return self._tree.query(points, k=1, workers=-1,
+                                    distance_upper_bound=distance_upper_bound)
+
+        bounded = np.isfinite(distance_upper_bound)
+        if self.backend == 'pykdtree':
+            distances, indices = self._tree.query(
+                np.ascontiguousarray(points, dtype=self._dtype), k=1,
+                distance_upper_bound=distance_upper_bound if bounded else None
+            )
+        else:
+            import open3d.core as o3c
+
+            query = o3c.Tensor.from_numpy(np.ascontiguousarray(points, dtype=self._dtype))
+            indices, squared_distances = self._nns.knn_search(query.to(self._device), 1)
+            distances = np.sqrt(squared_distances.cpu().numpy().reshape(-1))
+            indices = indices.cpu().numpy().reshape(-1)
+
+        if bounded:
+            # Same convention as cKDTree for points without a neighbour in range
+            unmatched = distances > distance_upper_bound
+            distances[unmatched] = np.inf
+            indices[unmatched] = self._size
+        return distances, indices
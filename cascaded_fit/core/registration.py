@@ -1,14 +1,37 @@
 """Core registration algorithms with logging and validation."""
 
+import threading
+import weakref
 import numpy as np
-from scipy.spatial import cKDTree
-from typing import Tuple
+from collections import OrderedDict
+from typing import Optional, Tuple
 from cascaded_fit.utils.logger import Logger
-from cascaded_fit.utils.exceptions import RegistrationError, ConvergenceError
+from cascaded_fit.utils.config import Config
+from cascaded_fit.utils.exceptions import (
+    RegistrationError,
+    ConvergenceError,
+    RegistrationCancelledError,
+    PointCloudValidationError
+)
 from cascaded_fit.core.validators import PointCloudValidator, TransformationValidator
+from cascaded_fit.core.neighbors import NearestNeighborIndex
 
 logger = Logger.get(__name__)
 
+# Points per nearest-neighbour batch in ICP; bounds the per-iteration working set
+ICP_QUERY_CHUNK_SIZE = 200_000
+
+# Mini-batch ICP warm-up stops once the sampled error has not reached a new
+# minimum for this many iterations (its noise floor)
+STOCHASTIC_PATIENCE = 10
+
+# Prepared ICP targets (centroid, float32 copy, index) kept for reuse
+TARGET_CACHE_SIZE = 4
+_target_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+# Reentrant: the eviction callback can fire from garbage collection while
+# the same thread already holds the lock
+_target_cache_lock = threading.RLock()
+
 
 class RegistrationAlgorithms:
     """Point cloud registration algorithms."""
@@ -18,6 +41,10 @@ class RegistrationAlgorithms:
         """
         PCA-based initial alignment.
 
+        The covariance pairs points by index; for clouds of different sizes
+        it uses the first min(N, M) points of each, while the translation
+        uses the centroids of the full clouds.
+
         Args:
             source: Source point cloud (Nx3)
             target: Target point cloud (Mx3)
@@ -32,29 +59,36 @@ class RegistrationAlgorithms:
 
         try:
             # Validate inputs
-            validator = PointCloudValidator()
+            validator = PointCloudValidator.default()
             validator.validate_pair(source, target)
 
             # Compute centroids
-            source_mean = np.mean(source, axis=0)
-            target_mean = np.mean(target, axis=0)
+            source_mean = np.mean(source, axis=0, dtype=np.float64)
+            target_mean = np.mean(target, axis=0, dtype=np.float64)
             logger.debug(f"Source centroid: {source_mean}")
             logger.debug(f"Target centroid: {target_mean}")
 
-            # Center point clouds
-            source_centered = source - source_mean
-            target_centered = target - target_mean
-
-            # Compute covariance and SVD
-            cov = np.dot(source_centered.T, target_centered)
-            U, _, Vt = np.linalg.svd(cov)
-            R = np.dot(Vt.T, U.T)
-
-            # Ensure right-handed coordinate system
-            if np.linalg.det(R) < 0:
-                logger.debug("Flipping rotation matrix to ensure right-handed system")
-                Vt[-1, :] *= -1
-                R = np.dot(Vt.T, U.T)
+            # Compute covariance and the best-fit rotation
+            if len(source) == len(target):
+                cov = RegistrationAlgorithms._cross_covariance(
+                    source, source_mean, target, target_mean
+                )
+            else:
+                n_pairs = min(len(source), len(target))
+                paired_source, paired_target = source[:n_pairs], target[:n_pairs]
+                cov = RegistrationAlgorithms._cross_covariance(
+                    paired_source, np.mean(paired_source, axis=0, dtype=np.float64),
+                    paired_target, np.mean(paired_target, axis=0, dtype=np.float64)
+                )
+
+            if RegistrationAlgorithms._is_symmetric_positive_definite(cov):
+                # Already rotationally aligned (e.g. re-registering a pair that
+                # differs by a translation): the best rotation is the identity
+                logger.debug("Covariance is symmetric positive definite, skipping rotation solve")
+                R = np.eye(3)
+            else:
+                # Same closed form as ICP: one 4x4 eigh, no SVD or reflection fix-up
+                R = RegistrationAlgorithms._rotation_from_covariance(cov)
 
             # Compute translation
             t = target_mean - np.dot(R, source_mean)
@@ -80,17 +114,43 @@ class RegistrationAlgorithms:
         target: np.ndarray,
         initial_transform: np.ndarray,
         max_iterations: int = 50,
-        tolerance: float = 1e-7
+        tolerance: float = 1e-7,
+        nn_backend: Optional[str] = None,
+        relative_tolerance: float = 1e-6,
+        patience: int = 3,
+        target_normals: Optional[np.ndarray] = None,
+        batch_size: Optional[int] = None,
+        max_correspondence_distance: Optional[float] = None,
+        stop_event: Optional[threading.Event] = None
     ) -> Tuple[np.ndarray, int, float]:
         """
         ICP refinement with detailed progress tracking.
 
+        Point-to-point by default. Given target normals, each iteration instead
+        minimises point-to-plane distances through the linearised 6x6 normal
+        equations, which typically converges in far fewer iterations on
+        smooth surfaces.
+
         Args:
             source: Source point cloud
             target: Target point cloud
             initial_transform: Initial transformation
             max_iterations: Maximum iterations
             tolerance: Convergence tolerance
+            nn_backend: Nearest-neighbour backend, 'cpu', 'cuda', 'auto' or 'pykdtree'
+                (config registration.nn_backend if None)
+            relative_tolerance: Relative error improvement counted as stagnation
+            patience: Consecutive stagnant iterations before declaring convergence
+            target_normals: Optional unit normals of target (Mx3), enabling
+                point-to-plane ICP
+            batch_size: If smaller than the source, first run mini-batch
+                iterations on this many sampled source points until the
+                sampled error settles, then finish with full-cloud iterations
+            max_correspondence_distance: If given, source points with no target
+                point within this distance are left out of the update and the
+                error; the bound also prunes each nearest-neighbour search
+            stop_event: Checked before every iteration; once set, refinement
+                is abandoned with RegistrationCancelledError
 
         Returns:
             Tuple of (final_transform, num_iterations, final_error)
@@ -98,64 +158,164 @@ class RegistrationAlgorithms:
         Raises:
             RegistrationError: If ICP fails
             ConvergenceError: If ICP doesn't converge
+            RegistrationCancelledError: If stop_event is set
         """
         logger.info(f"Starting ICP refinement (max_iter={max_iterations}, tol={tolerance})")
 
         try:
             # Validate inputs
-            validator = PointCloudValidator()
+            validator = PointCloudValidator.default()
             validator.validate_pair(source, target)
             TransformationValidator.validate(initial_transform)
-
-            # Build KD-Tree from target
-            logger.debug("Building KD-Tree from target points")
-            tree = cKDTree(target)
-
-            current_transform = initial_transform.copy()
+            if target_normals is not None and target_normals.shape != target.shape:
+                raise PointCloudValidationError(
+                    f"Target normals shape {target_normals.shape} does not match target {target.shape}"
+                )
+
+            # Iterate on float32 points (half the bytes per pass) in a frame
+            # centred on the target centroid, which keeps the uncentered
+            # covariance well-conditioned; 3x3 math stays in float64
+            if nn_backend is None:
+                nn_backend = Config.get_registration_config().nn_backend
+            origin, target, tree = RegistrationAlgorithms._prepare_target(target, nn_backend)
+            source = np.ascontiguousarray(source - origin, dtype=np.float32)
+
+            # Conjugate into the centred frame: t' = t + R o - o
+            current_transform = np.array(initial_transform, dtype=np.float64)
+            current_transform[:3, 3] += current_transform[:3, :3] @ origin - origin
             prev_error = np.inf
+            stale_iterations = 0
+            increment = np.eye(4)
+
+            # transformed_source is an affine image of source, so its centroid
+            # is R @ source_centroid + t: no per-iteration reduction needed
+            source_centroid = np.mean(source, axis=0, dtype=np.float64)
+            n_points = len(source)
+
+            # Reused gather buffer for matched target points, so correspondences
+            # are written into the same memory every chunk and iteration
+            matched_buffer = np.empty((min(n_points, ICP_QUERY_CHUNK_SIZE), 3), dtype=target.dtype)
+            point_to_plane = target_normals is not None
+            bounded = max_correspondence_distance is not None
+            upper_bound = max_correspondence_distance if bounded else np.inf
+            if point_to_plane:
+                # Normals are translation invariant, so the centred frame needs no change
+                target_normals = np.ascontiguousarray(target_normals, dtype=np.float32)
+                normals_buffer = np.empty_like(matched_buffer)
+
+            warmup_iterations = 0
+            if batch_size is not None and batch_size < n_points:
+                current_transform, warmup_iterations = RegistrationAlgorithms._stochastic_warmup(
+                    source, target, tree, current_transform, batch_size, max_iterations
+                )
+
+            # Transform source once; each iteration then applies only its
+            # incremental correction to this buffer in place
+            transformed_source = RegistrationAlgorithms.apply_transformation(
+                source, current_transform, out=np.empty(source.shape, dtype=np.float32)
+            )
 
             for iteration in range(max_iterations):
-                # Transform source points
-                transformed_source = np.dot(
-                    source, current_transform[:3, :3].T
-                ) + current_transform[:3, 3]
-
-                # Find nearest neighbors
-                distances, indices = tree.query(transformed_source)
-                corresponding_points = target[indices]
+                if stop_event is not None and stop_event.is_set():
+                    raise RegistrationCancelledError("ICP refinement cancelled")
+
+                # Find nearest neighbors chunk by chunk, folding each chunk into
+                # running sums so no full-length distance/index/gather arrays
+                # are held and each chunk stays cache-resident while reduced
+                error_sum = 0.0
+                n_matched = 0
+                source_sum = np.zeros(3)
+                target_sum = np.zeros(3)
+                cov = np.zeros((3, 3))
+                normal_matrix = np.zeros((6, 6))
+                normal_rhs = np.zeros(6)
+                for start in range(0, n_points, ICP_QUERY_CHUNK_SIZE):
+                    chunk = transformed_source[start:start + ICP_QUERY_CHUNK_SIZE]
+                    distances, indices = tree.query(chunk, distance_upper_bound=upper_bound)
+                    if bounded:
+                        # Points with nothing in range come back at inf; drop them
+                        inliers = np.isfinite(distances)
+                        chunk, distances, indices = chunk[inliers], distances[inliers], indices[inliers]
+                        source_sum += chunk.sum(axis=0, dtype=np.float64)
+                    n_matched += len(chunk)
+                    matched = np.take(target, indices, axis=0, out=matched_buffer[:len(chunk)])
+
+                    error_sum += distances.sum(dtype=np.float64)
+                    if point_to_plane:
+                        # Rows [p x n, n] . [w, t] = n . (q - p) linearise
+                        # n . (R p + t - q) for a small rotation w
+                        normals = np.take(target_normals, indices, axis=0,
+                                          out=normals_buffer[:len(chunk)])
+                        jacobian = np.hstack((np.cross(chunk, normals), normals))
+                        residual = np.einsum('ij,ij->i', normals, matched - chunk)
+                        normal_matrix += np.dot(jacobian.T, jacobian)
+                        normal_rhs += np.dot(jacobian.T, residual)
+                    else:
+                        target_sum += matched.sum(axis=0, dtype=np.float64)
+                        cov += np.dot(chunk.T, matched)
+
+                if n_matched == 0:
+                    raise RegistrationError(
+                        f"No correspondences within {max_correspondence_distance}"
+                    )
 
                 # Compute error
-                error = np.mean(distances)
+                error = error_sum / n_matched
 
                 if iteration % 10 == 0:
                     logger.debug(f"Iteration {iteration}: error = {error:.6f}")
 
-                # Check convergence
-                if np.abs(error - prev_error) < tolerance:
-                    logger.info(f"ICP converged after {iteration + 1} iterations (error={error:.6f})")
-                    return current_transform, iteration + 1, error
+                # Check convergence: absolute change, a (near-)exact fit, or the
+                # error settling (improving by less than relative_tolerance) for
+                # `patience` consecutive iterations; the absolute tolerance alone
+                # depends on cloud units and may never trigger
+                if 0 <= prev_error - error < relative_tolerance * prev_error:
+                    stale_iterations += 1
+                else:
+                    stale_iterations = 0
+
+                if (np.abs(error - prev_error) < tolerance or error < 1e-12
+                        or stale_iterations >= patience):
+                    iterations = warmup_iterations + iteration + 1
+                    logger.info(f"ICP converged after {iterations} iterations (error={error:.6f})")
+                    # Back from the centred frame: t = t' + o - R o
+                    current_transform[:3, 3] += origin - current_transform[:3, :3] @ origin
+                    return current_transform, iterations, error
 
                 prev_error = error
 
-                # Compute incremental transformation via SVD
-                source_mean = np.mean(transformed_source, axis=0)
-                target_mean = np.mean(corresponding_points, axis=0)
-                source_centered = transformed_source - source_mean
-                target_centered = corresponding_points - target_mean
-
-                cov = np.dot(source_centered.T, target_centered)
-                U, _, Vt = np.linalg.svd(cov)
-                R = np.dot(Vt.T, U.T)
-
-                if np.linalg.det(R) < 0:
-                    Vt[-1, :] *= -1
-                    R = np.dot(Vt.T, U.T)
-
-                t = target_mean - np.dot(R, source_mean)
-
-                # Update cumulative transformation
-                current_transform[:3, :3] = np.dot(R, current_transform[:3, :3])
-                current_transform[:3, 3] = np.dot(R, current_transform[:3, 3]) + t
+                if point_to_plane:
+                    # Solve the 6x6 normal equations for (w, t); lstsq covers
+                    # degenerate geometry such as a single plane
+                    try:
+                        step = np.linalg.solve(normal_matrix, normal_rhs)
+                    except np.linalg.LinAlgError:
+                        step = np.linalg.lstsq(normal_matrix, normal_rhs, rcond=None)[0]
+                    increment[:3, :3] = RegistrationAlgorithms._rotation_from_axis_angle(step[:3])
+                    increment[:3, 3] = step[3:]
+                else:
+                    # Compute incremental transformation (Horn's closed form)
+                    if bounded:
+                        source_mean = source_sum / n_matched
+                    else:
+                        source_mean = current_transform[:3, :3] @ source_centroid + current_transform[:3, 3]
+                    target_mean = target_sum / n_matched
+
+                    # sum((s - s_mean)(t - t_mean)^T) = S^T T - n s_mean t_mean^T:
+                    # S^T T was accumulated per chunk, no centered (N, 3) temporaries
+                    cov -= n_matched * np.outer(source_mean, target_mean)
+                    R = RegistrationAlgorithms._rotation_from_covariance(cov)
+
+                    increment[:3, :3] = R
+                    increment[:3, 3] = target_mean - np.dot(R, source_mean)
+
+                # Update cumulative transformation with one 4x4 product
+                np.matmul(increment, current_transform, out=current_transform)
+
+                # Apply the increment to the already-transformed points
+                RegistrationAlgorithms.apply_transformation(
+                    transformed_source, increment, out=transformed_source
+                )
 
             # Didn't converge within max iterations
             logger.warning(f"ICP did not converge after {max_iterations} iterations (error={prev_error:.6f})")
@@ -163,12 +323,231 @@ class RegistrationAlgorithms:
                 f"ICP did not converge after {max_iterations} iterations"
             )
 
-        except ConvergenceError:
+        except (ConvergenceError, RegistrationCancelledError):
             raise
         except Exception as e:
             logger.error(f"ICP refinement failed: {e}", exc_info=True)
             raise RegistrationError(f"ICP refinement failed: {e}")
 
+    @staticmethod
+    def _stochastic_warmup(source: np.ndarray, target: np.ndarray,
+                           tree: NearestNeighborIndex, transform: np.ndarray,
+                           batch_size: int, max_iterations: int) -> Tuple[np.ndarray, int]:
+        """
+        Coarse ICP iterations on random mini-batches of the source.
+
+        Each iteration samples batch_size source points, matches only those
+        and applies Horn's closed-form update for the batch, so its cost is
+        O(batch_size) rather than O(N). Stops once the sampled mean error has
+        not set a new minimum for STOCHASTIC_PATIENCE iterations, i.e. it has
+        reached the sampling noise floor, or after max_iterations.
+
+        Args:
+            source: Source points in the ICP frame (Nx3)
+            target: Target points in the ICP frame (Mx3)
+            tree: Nearest-neighbour index over target
+            transform: Starting 4x4 transformation (not modified)
+            batch_size: Source points sampled per iteration
+            max_iterations: Iteration cap
+
+        Returns:
+            Tuple of (transform, iterations run)
+        """
+        # Fixed seed keeps repeated registrations of the same pair identical
+        rng = np.random.default_rng(0)
+        transform = transform.copy()
+        batch = np.empty((batch_size, 3), dtype=source.dtype)
+        increment = np.eye(4)
+        best_error = np.inf
+        settled = 0
+
+        for iteration in range(max_iterations):
+            # Sampling with replacement avoids an O(N) permutation per draw
+            np.take(source, rng.integers(0, len(source), batch_size), axis=0, out=batch)
+            RegistrationAlgorithms.apply_transformation(batch, transform, out=batch)
+
+            distances, indices = tree.query(batch)
+            matched = target[indices]
+            error = distances.mean(dtype=np.float64)
+
+            if error < best_error:
+                best_error = error
+                settled = 0
+            else:
+                settled += 1
+                if settled >= STOCHASTIC_PATIENCE:
+                    logger.debug(f"Mini-batch warm-up settled after {iteration + 1} iterations "
+                                 f"(sampled error={best_error:.6f})")
+                    return transform, iteration + 1
+
+            batch_mean = batch.mean(axis=0, dtype=np.float64)
+            matched_mean = matched.mean(axis=0, dtype=np.float64)
+            cov = RegistrationAlgorithms._cross_covariance(batch, batch_mean, matched, matched_mean)
+            R = RegistrationAlgorithms._rotation_from_covariance(cov)
+
+            increment[:3, :3] = R
+            increment[:3, 3] = matched_mean - np.dot(R, batch_mean)
+            np.matmul(increment, transform, out=transform)
+
+        return transform, max_iterations
+
+    @staticmethod
+    def _prepare_target(target: np.ndarray,
+                        nn_backend: str) -> Tuple[np.ndarray, np.ndarray, NearestNeighborIndex]:
+        """
+        Centre a target cloud, cast it to float32 and index it for ICP.
+
+        Results are cached for the last few target arrays, so repeated ICP
+        runs against the same target (e.g. several sources registered to one
+        reference) skip the KD-Tree build. Hits require the very same array
+        object; modifying a target in place between calls is not detected.
+        The cache is shared by concurrent callers and guarded by a lock; the
+        index itself is built outside it.
+
+        Args:
+            target: Target point cloud (Mx3)
+            nn_backend: Nearest-neighbour backend name
+
+        Returns:
+            Tuple of (origin, centred float32 target, nearest-neighbour index)
+        """
+        key = (id(target), target.__array_interface__['data'][0], target.shape, nn_backend)
+        with _target_cache_lock:
+            cached = _target_cache.get(key)
+            if cached is not None and cached[0]() is target:
+                _target_cache.move_to_end(key)
+            else:
+                cached = None
+        if cached is not None:
+            logger.debug("Reusing cached nearest-neighbour index for target")
+            return cached[1:]
+
+        origin = np.mean(target, axis=0, dtype=np.float64)
+        target_local = np.ascontiguousarray(target - origin, dtype=np.float32)
+
+        # Build nearest-neighbour index from target (GPU-resident for 'cuda')
+        logger.debug(f"Building {nn_backend} nearest-neighbour index from target points")
+        tree = NearestNeighborIndex(target_local, backend=nn_backend)
+
+        # Drop the entry as soon as the caller's array is garbage collected
+        def evict(_):
+            with _target_cache_lock:
+                _target_cache.pop(key, None)
+
+        target_ref = weakref.ref(target, evict)
+        with _target_cache_lock:
+            _target_cache[key] = (target_ref, origin, target_local, tree)
+            if len(_target_cache) > TARGET_CACHE_SIZE:
+                _target_cache.popitem(last=False)
+        return origin, target_local, tree
+
+    @staticmethod
+    def _is_symmetric_positive_definite(cov: np.ndarray) -> bool:
+        """
+        Check whether a 3x3 cross-covariance is symmetric positive definite.
+
+        The best-fit rotation is the orthogonal polar factor of the covariance,
+        which is exactly the identity in this case. Uses Sylvester's criterion
+        on the leading minors, so no decomposition is needed.
+
+        Args:
+            cov: 3x3 cross-covariance matrix
+
+        Returns:
+            True if the optimal rotation is the identity
+        """
+        tolerance = 1e-9 * np.abs(cov).max()
+        if not np.allclose(cov, cov.T, rtol=0.0, atol=tolerance):
+            return False
+
+        (a, b, c), (_, d, e), (_, _, f) = cov
+        minor2 = a * d - b * b
+        det = a * (d * f - e * e) - b * (b * f - e * c) + c * (b * e - d * c)
+        return bool(a > 0 and minor2 > 0 and det > 0)
+
+    @staticmethod
+    def _cross_covariance(source: np.ndarray, source_mean: np.ndarray,
+                          target: np.ndarray, target_mean: np.ndarray) -> np.ndarray:
+        """
+        Cross-covariance of corresponding point sets.
+
+        Both sides are centred, in float64. Centring only one side is exact in
+        theory but cancels badly when the other side sits far from the origin,
+        and float32 input at real-world coordinates loses the rotation entirely.
+
+        Args:
+            source: Source points (Nx3)
+            source_mean: Centroid of source
+            target: Corresponding target points (Nx3)
+            target_mean: Centroid of target
+
+        Returns:
+            3x3 cross-covariance matrix
+        """
+        source_centered = source - np.asarray(source_mean, dtype=np.float64)
+        target_centered = target - np.asarray(target_mean, dtype=np.float64)
+        return np.dot(source_centered.T, target_centered)
+
+    @staticmethod
+    def _rotation_from_covariance(cov: np.ndarray) -> np.ndarray:
+        """
+        Best-fit rotation for a 3x3 cross-covariance via Horn's quaternion method.
+
+        The optimal unit quaternion is the eigenvector of the largest eigenvalue
+        of a symmetric 4x4 matrix built from the covariance entries. This avoids
+        an SVD and always yields a proper rotation, so no reflection fix-up is
+        needed.
+
+        Args:
+            cov: 3x3 covariance sum(source_centered^T target_centered)
+
+        Returns:
+            3x3 rotation matrix R minimising |R @ source - target|
+        """
+        (sxx, sxy, sxz), (syx, syy, syz), (szx, szy, szz) = cov
+        N = np.array([
+            [sxx + syy + szz, syz - szy, szx - sxz, sxy - syx],
+            [syz - szy, sxx - syy - szz, sxy + syx, szx + sxz],
+            [szx - sxz, sxy + syx, syy - sxx - szz, syz + szy],
+            [sxy - syx, szx + sxz, syz + szy, szz - sxx - syy]
+        ])
+
+        # eigh returns eigenvalues in ascending order
+        _, eigenvectors = np.linalg.eigh(N)
+        w, x, y, z = eigenvectors[:, -1]
+
+        return np.array([
+            [w * w + x * x - y * y - z * z, 2 * (x * y - w * z), 2 * (x * z + w * y)],
+            [2 * (x * y + w * z), w * w - x * x + y * y - z * z, 2 * (y * z - w * x)],
+            [2 * (x * z - w * y), 2 * (y * z + w * x), w * w - x * x - y * y + z * z]
+        ])
+
+    @staticmethod
+    def _rotation_from_axis_angle(rotation_vector: np.ndarray) -> np.ndarray:
+        """
+        Rotation matrix for an axis-angle vector (Rodrigues' formula).
+
+        Used instead of the small-angle matrix I + [w]x so that point-to-plane
+        updates stay exactly orthonormal.
+
+        Args:
+            rotation_vector: Rotation axis scaled by the angle in radians
+
+        Returns:
+            3x3 rotation matrix
+        """
+        angle = np.linalg.norm(rotation_vector)
+        if angle < 1e-12:
+            return np.eye(3)
+
+        x, y, z = rotation_vector / angle
+        K = np.array([
+            [0.0, -z, y],
+            [z, 0.0, -x],
+            [-y, x, 0.0]
+        ])
+        return np.eye(3) + np.sin(angle) * K + (1.0 - np.cos(angle)) * (K @ K)
+
     @staticmethod
     def calculate_transformation_matrix(source_points: np.ndarray,
                                       transformed_points: np.ndarray) -> np.ndarray:
@@ -183,18 +562,14 @@ class RegistrationAlgorithms:
             4x4 transformation matrix
         """
         # Center the point sets
-        source_center = np.mean(source_points, axis=0)
-        transformed_center = np.mean(transformed_points, axis=0)
+        source_center = np.mean(source_points, axis=0, dtype=np.float64)
+        transformed_center = np.mean(transformed_points, axis=0, dtype=np.float64)
 
-        # Calculate the rotation matrix using SVD
-        H = np.dot((source_points - source_center).T, (transformed_points - transformed_center))
-        U, S, Vt = np.linalg.svd(H)
-        R = np.dot(Vt.T, U.T)
-
-        # Ensure a right-handed coordinate system
-        if np.linalg.det(R) < 0:
-            Vt[-1, :] *= -1
-            R = np.dot(Vt.T, U.T)
+        # Calculate the rotation matrix from the cross-covariance
+        H = RegistrationAlgorithms._cross_covariance(
+            source_points, source_center, transformed_points, transformed_center
+        )
+        R = RegistrationAlgorithms._rotation_from_covariance(H)
 
         # Calculate the translation
         t = transformed_center - np.dot(R, source_center)
@@ -207,15 +582,24 @@ class RegistrationAlgorithms:
         return transform
 
     @staticmethod
-    def apply_transformation(points: np.ndarray, transform: np.ndarray) -> np.ndarray:
+    def apply_transformation(points: np.ndarray, transform: np.ndarray,
+                             out: Optional[np.ndarray] = None) -> np.ndarray:
         """
         Apply a 4x4 transformation matrix to a set of 3D points.
 
+        The rotation is written straight into the output and the translation
+        added in place, so no intermediate (N, 3) array is allocated.
+
         Args:
             points: Nx3 numpy array of points
             transform: 4x4 transformation matrix
+            out: Optional preallocated Nx3 output buffer (may be points itself)
 
         Returns:
             Nx3 numpy array of transformed points
         """
-        return np.dot(points, transform[:3, :3].T) + transform[:3, 3]
+        if out is None:
+            out = np.empty(points.shape, dtype=np.result_type(points, transform))
+        np.matmul(points, transform[:3, :3].T, out=out)
+        out += transform[:3, 3]
+        return out
@@ -1,5 +1,6 @@
 """Transformation utilities."""
 
+import io
 import numpy as np
 
 
@@ -25,20 +26,38 @@ class TransformationUtils:
         """
         Convert numpy array to CSV string.
 
+        Values are written with 50 fixed decimals, as float_to_max_decimals_string
+        does, in a single np.savetxt call.
+
         Args:
             array: Numpy array (typically 4x4 transformation matrix)
 
         Returns:
             CSV-formatted string
         """
-        csv_string = ""
-        for row in array:
-            row_string = ",".join(
-                TransformationUtils.float_to_max_decimals_string(value)
-                for value in row
-            )
-            csv_string += row_string + "\n"
+        buffer = io.StringIO()
+        np.savetxt(buffer, array, fmt='%.50f', delimiter=',')
 
         # Remove final newline
-        csv_string = csv_string.rstrip("\n")
-        return csv_string
+        return buffer.getvalue().rstrip("\n")
+
+    @staticmethod
+    def invert_rigid(transform: np.ndarray) -> np.ndarray:
+        """
+        Invert a 4x4 rigid transformation analytically.
+
+        Uses [R | t]^-1 = [R^T | -R^T t], which is cheaper than a general
+        LU inverse and keeps the rotation block exactly orthogonal.
+
+        Args:
+            transform: 4x4 rigid transformation matrix
+
+        Returns:
+            Inverse 4x4 transformation matrix
+        """
+        rotation_t = transform[:3, :3].T
+        inverse = np.empty_like(transform)
+        inverse[:3, :3] = rotation_t
+        inverse[:3, 3] = -rotation_t @ transform[:3, 3]
+        inverse[3] = (0.0, 0.0, 0.0, 1.0)
+        return inverse
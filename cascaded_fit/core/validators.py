@@ -1,7 +1,8 @@
 """Input validation for point clouds and parameters."""
 
 import numpy as np
-from typing import Tuple
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
 from cascaded_fit.utils.exceptions import (
     PointCloudValidationError,
     InsufficientPointsError
@@ -12,12 +13,31 @@ from cascaded_fit.utils.config import Config
 class PointCloudValidator:
     """Validate point cloud data."""
 
+    _default: Optional["PointCloudValidator"] = None
+    _default_source: Optional[Dict[str, Any]] = None
+
     def __init__(self) -> None:
         self.min_points = Config.get('validation.min_points', 100)
         self.max_points = Config.get('validation.max_points', 10_000_000)
         self.check_nan = Config.get('validation.check_nan', True)
         self.check_inf = Config.get('validation.check_inf', True)
 
+    @classmethod
+    def default(cls) -> "PointCloudValidator":
+        """
+        Get a shared validator for the currently loaded configuration.
+
+        The instance is rebuilt only when a different config is loaded, so hot
+        registration paths skip the per-call config lookups.
+
+        Returns:
+            PointCloudValidator instance
+        """
+        if cls._default is None or cls._default_source is not Config._config:
+            cls._default = cls()
+            cls._default_source = Config._config
+        return cls._default
+
     def validate(self, points: np.ndarray, name: str = "point cloud") -> None:
         """
         Validate point cloud array.
@@ -56,15 +76,20 @@ class PointCloudValidator:
                 f"{name} has too many points: {n_points} > {self.max_points}"
             )
 
-        # Check for NaN or Inf
+        # Check for NaN or Inf. Both propagate through a sum, so one reduction
+        # clears the common case; only confirm element-wise if the sum is not
+        # finite, since very large finite values can also overflow it
         if self.check_nan and self.check_inf:
-            if not np.isfinite(points).all():
+            with np.errstate(over='ignore', invalid='ignore'):
+                total = points.sum()
+            if not np.isfinite(total) and not np.isfinite(points).all():
                 raise PointCloudValidationError(
                     f"{name} contains NaN or Inf values"
                 )
 
-        # Check for empty point cloud (all zeros)
-        if np.allclose(points, 0):
+        # Check for empty point cloud (all zeros); any() stops at the first
+        # non-zero value instead of running tolerance math over every element
+        if points.size and not points.any():
             raise PointCloudValidationError(
                 f"{name} appears to be all zeros"
             )
@@ -105,31 +130,45 @@ class TransformationValidator:
                 f"Transform must be 4x4, got shape {transform.shape}"
             )
 
-        if not np.isfinite(transform).all():
-            raise PointCloudValidationError(
-                "Transform contains NaN or Inf values"
-            )
+        # Most pipelines validate the same few transforms repeatedly; the
+        # numeric checks are cached on the matrix bytes
+        error = _check_transform(np.ascontiguousarray(transform, dtype=np.float64).tobytes())
+        if error is not None:
+            raise PointCloudValidationError(error)
 
-        # Check bottom row is [0, 0, 0, 1]
-        expected_bottom = np.array([0, 0, 0, 1])
-        if not np.allclose(transform[3, :], expected_bottom):
-            raise PointCloudValidationError(
-                f"Transform bottom row must be [0,0,0,1], got {transform[3,:]}"
-            )
 
-        # Check rotation matrix properties (top-left 3x3)
-        R = transform[:3, :3]
+@lru_cache(maxsize=128)
+def _check_transform(transform_bytes: bytes) -> Optional[str]:
+    """
+    Run the numeric checks for a 4x4 float64 transform.
 
-        # Check orthogonality: R @ R.T should be identity
-        I = np.eye(3)
-        if not np.allclose(R @ R.T, I, atol=1e-6):
-            raise PointCloudValidationError(
-                "Rotation matrix is not orthogonal"
-            )
+    Args:
+        transform_bytes: Raw bytes of a C-contiguous 4x4 float64 matrix
 
-        # Check determinant is +1 (proper rotation)
-        det = np.linalg.det(R)
-        if not np.isclose(det, 1.0, atol=1e-6):
-            raise PointCloudValidationError(
-                f"Rotation matrix determinant must be 1, got {det}"
-            )
+    Returns:
+        Error message, or None if the transform is a valid rigid transform
+    """
+    transform = np.frombuffer(transform_bytes, dtype=np.float64).reshape(4, 4)
+
+    if not np.isfinite(transform).all():
+        return "Transform contains NaN or Inf values"
+
+    # Check bottom row is [0, 0, 0, 1]
+    expected_bottom = np.array([0, 0, 0, 1])
+    if not np.allclose(transform[3, :], expected_bottom):
+        return f"Transform bottom row must be [0,0,0,1], got {transform[3,:]}"
+
+    # Check rotation matrix properties (top-left 3x3)
+    R = transform[:3, :3]
+
+    # Check orthogonality: R @ R.T should be identity
+    I = np.eye(3)
+    if not np.allclose(R @ R.T, I, atol=1e-6):
+        return "Rotation matrix is not orthogonal"
+
+    # Check determinant is +1 (proper rotation)
+    det = np.linalg.det(R)
+    if not np.isclose(det, 1.0, atol=1e-6):
+        return f"Rotation matrix determinant must be 1, got {det}"
+
+    return None
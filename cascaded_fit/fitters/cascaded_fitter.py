@@ -2,13 +2,12 @@
 
 import time
 from typing import TYPE_CHECKING, Dict, Any, Optional
-import open3d as o3d
-import copy
 from cascaded_fit.utils.logger import Logger
 from cascaded_fit.utils.exceptions import RegistrationError, ConvergenceError
 from cascaded_fit.io.readers import PointCloudReader
 
 if TYPE_CHECKING:
+    import open3d as o3d
     from cascaded_fit.fitters.icp_fitter import IcpFitter, FitResult
     from cascaded_fit.fitters.fgr_fitter import FgrFitter
 
@@ -45,6 +44,11 @@ class CascadedFitter:
         # Keep old attribute for backward compatibility
         self.visualise = self.visualize
 
+        # Painted display copies, built on first visualization
+        self._src_viz = None
+        self._tgt_viz = None
+        self._viz_inputs = None
+
         logger.info("CascadedFitter initialized")
 
     def run(self, source_file: str, target_file: str) -> Dict[str, Any]:
@@ -66,7 +70,37 @@ class CascadedFitter:
 
         try:
             self._read_point_clouds(source_file, target_file)
+        except Exception as e:
+            logger.error(f"Cascaded registration failed: {e}", exc_info=True)
+            raise RegistrationError(f"Registration failed: {e}")
+
+        return self._run_cascade()
+
+    def run_from_clouds(self, source_cloud: "o3d.geometry.PointCloud",
+                        target_cloud: "o3d.geometry.PointCloud") -> Dict[str, Any]:
+        """
+        Run cascaded registration pipeline on clouds already in memory.
+
+        Args:
+            source_cloud: Source point cloud
+            target_cloud: Target point cloud
+
+        Returns:
+            Registration result dictionary
+
+        Raises:
+            RegistrationError: If registration fails
+        """
+        logger.info("Starting cascaded registration on in-memory clouds")
+        self.start_time = time.time()
 
+        self.source_cloud = source_cloud
+        self.target_cloud = target_cloud
+        return self._run_cascade()
+
+    def _run_cascade(self) -> Dict[str, Any]:
+        """Run ICP, falling back to FGR, on the loaded clouds."""
+        try:
             # Try ICP first
             icp_result = self._try_icp_fit()
             if icp_result.is_success:
@@ -134,22 +168,29 @@ class CascadedFitter:
 
     def _visualize_results(self, fit_result: "FitResult") -> None:
         """Visualize registration results."""
+        import open3d as o3d
+
         logger.debug("Visualizing results")
 
+        # Points-only copies painted once per input pair; normals and colors
+        # of the inputs are not needed for display
+        if (self._viz_inputs is None or self._viz_inputs[0] is not self.source_cloud
+                or self._viz_inputs[1] is not self.target_cloud):
+            self._src_viz = o3d.geometry.PointCloud(self.source_cloud.points)
+            self._tgt_viz = o3d.geometry.PointCloud(self.target_cloud.points)
+            self._src_viz.paint_uniform_color([1, 0.706, 0])  # Orange
+            self._tgt_viz.paint_uniform_color([0, 0.651, 0.929])  # Blue
+            self._viz_inputs = (self.source_cloud, self.target_cloud)
+        else:
+            # Undo the previous call's transform; colors are kept
+            self._src_viz.points = self.source_cloud.points
+
         # Visualize before registration
-        source_temp = copy.deepcopy(self.source_cloud)
-        target_temp = copy.deepcopy(self.target_cloud)
-        source_temp.paint_uniform_color([1, 0.706, 0])  # Orange
-        target_temp.paint_uniform_color([0, 0.651, 0.929])  # Blue
-        o3d.visualization.draw_geometries([source_temp, target_temp])
-
-        # Visualize after registration
-        source_temp = copy.deepcopy(self.source_cloud)
-        target_temp = copy.deepcopy(self.target_cloud)
-        source_temp.paint_uniform_color([1, 0.706, 0])
-        target_temp.paint_uniform_color([0, 0.651, 0.929])
-        source_temp.transform(fit_result.transformation)
-        o3d.visualization.draw_geometries([source_temp, target_temp])
+        o3d.visualization.draw_geometries([self._src_viz, self._tgt_viz])
+
+        # Visualize after registration: only the source geometry changes
+        self._src_viz.transform(fit_result.transformation)
+        o3d.visualization.draw_geometries([self._src_viz, self._tgt_viz])
         
     def _visualise_results(self, fit_result: "FitResult") -> None:
         """Visualize registration results (deprecated, use _visualize_results)."""
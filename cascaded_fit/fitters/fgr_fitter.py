@@ -1,13 +1,14 @@
 """FGR (Fast Global Registration) fitter."""
 
 import time
-from typing import TYPE_CHECKING, Optional
-import open3d as o3d
+import weakref
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
 from cascaded_fit.utils.logger import Logger
 from cascaded_fit.utils.config import Config
 from cascaded_fit.utils.exceptions import RegistrationError
 
 if TYPE_CHECKING:
+    import open3d as o3d
     from cascaded_fit.fitters.icp_fitter import IcpFitter, FitResult
 
 logger = Logger.get(__name__)
@@ -53,15 +54,39 @@ class FgrFitter:
         self.max_nn_normal = max_nn_normal or fgr_config.max_nn_normal
         self.max_nn_feature = max_nn_feature or fgr_config.max_nn_feature
 
+        # Open3D is slow to import; defer it until a fitter is actually built
+        import open3d as o3d
+
+        # Open3D parameter objects are reused across fits
+        self._fgr_option = o3d.pipelines.registration.FastGlobalRegistrationOption(
+            maximum_correspondence_distance=self.distance_threshold
+        )
+        self._normal_search_param = o3d.geometry.KDTreeSearchParamHybrid(
+            radius=self.voxel_size * self.radius_normal_factor,
+            max_nn=self.max_nn_normal
+        )
+        self._feature_search_param = o3d.geometry.KDTreeSearchParamHybrid(
+            radius=self.voxel_size * self.radius_feature_factor,
+            max_nn=self.max_nn_feature
+        )
+
+        # Per live cloud caches keyed on (id(cloud), params). Entries are
+        # evicted when the cloud is garbage collected, so ids are never reused.
+        self._fpfh_cache: Dict[Tuple, "o3d.pipelines.registration.Feature"] = {}
+        self._downsample_cache: Dict[Tuple, "o3d.geometry.PointCloud"] = {}
+
         logger.info(f"FgrFitter initialized: voxel_size={self.voxel_size}, "
                    f"normal_factor={self.radius_normal_factor}, "
                    f"feature_factor={self.radius_feature_factor}")
 
-    def fit(self, source_cloud: o3d.geometry.PointCloud,
-            target_cloud: o3d.geometry.PointCloud) -> "FitResult":
+    def fit(self, source_cloud: "o3d.geometry.PointCloud",
+            target_cloud: "o3d.geometry.PointCloud") -> "FitResult":
         """
         Fit source cloud to target cloud using FGR + ICP.
 
+        FGR runs on voxel-downsampled copies of both clouds; the ICP
+        refinement uses the original clouds.
+
         Args:
             source_cloud: Source point cloud (Open3D)
             target_cloud: Target point cloud (Open3D)
@@ -72,7 +97,10 @@ class FgrFitter:
         logger.info("Trying FGR and ICP combination fit...")
 
         try:
-            fgr_result = self._execute_fgr(source_cloud, target_cloud)
+            # Global alignment only needs voxel resolution; ICP below refines
+            # on the full clouds
+            fgr_result = self._execute_fgr(self._downsample(source_cloud),
+                                           self._downsample(target_cloud))
 
             # Improve fit using ICP with initial guess from FGR
             if self.icp_fitter is None:
@@ -94,27 +122,24 @@ class FgrFitter:
             logger.error(f"FGR+ICP fit failed: {e}", exc_info=True)
             raise RegistrationError(f"FGR+ICP failed: {e}")
 
-    def _execute_fgr(self, source_cloud: o3d.geometry.PointCloud,
-                     target_cloud: o3d.geometry.PointCloud) -> o3d.pipelines.registration.RegistrationResult:
+    def _execute_fgr(self, source_cloud: "o3d.geometry.PointCloud",
+                     target_cloud: "o3d.geometry.PointCloud") -> "o3d.pipelines.registration.RegistrationResult":
         """Execute FGR registration."""
+        import open3d as o3d
+
         start_time = time.time()
 
         # Calculate FPFH features
         source_fpfh = self._calculate_fpfh(source_cloud)
         target_fpfh = self._calculate_fpfh(target_cloud)
 
-        # FGR options
-        fgr_option = o3d.pipelines.registration.FastGlobalRegistrationOption(
-            maximum_correspondence_distance=self.distance_threshold
-        )
-
         # Run FGR
         result = o3d.pipelines.registration.registration_fgr_based_on_feature_matching(
             source_cloud,
             target_cloud,
             source_fpfh,
             target_fpfh,
-            fgr_option
+            self._fgr_option
         )
 
         execution_time = time.time() - start_time
@@ -123,36 +148,79 @@ class FgrFitter:
 
         return result
 
-    def _calculate_fpfh(self, point_cloud: o3d.geometry.PointCloud) -> o3d.pipelines.registration.Feature:
+    def _calculate_fpfh(self, point_cloud: "o3d.geometry.PointCloud") -> "o3d.pipelines.registration.Feature":
         """
         Calculate FPFH (Fast Point Feature Histogram) features.
 
+        Features are cached per cloud object, so a target matched against many
+        sources is only described once. Call clear_cache() after mutating a
+        cloud in place.
+
         Args:
             point_cloud: Open3D point cloud
 
         Returns:
             FPFH features
         """
+        import open3d as o3d
+
+        key = (id(point_cloud), self.voxel_size, self.radius_normal_factor,
+               self.radius_feature_factor, self.max_nn_normal, self.max_nn_feature)
+        cached = self._fpfh_cache.get(key)
+        if cached is not None:
+            logger.debug("Reusing cached FPFH features")
+            return cached
+
         # Calculate radii using configurable factors (FIXED TODO)
         radius_normal = self.voxel_size * self.radius_normal_factor
         radius_feature = self.voxel_size * self.radius_feature_factor
 
         logger.debug(f"Estimating normals with radius {radius_normal:.3f}")
-        point_cloud.estimate_normals(
-            o3d.geometry.KDTreeSearchParamHybrid(
-                radius=radius_normal,
-                max_nn=self.max_nn_normal
-            )
-        )
+        point_cloud.estimate_normals(self._normal_search_param)
 
         logger.debug(f"Computing FPFH features with radius {radius_feature:.3f}")
-        kdTreeSearchParams = o3d.geometry.KDTreeSearchParamHybrid(
-            radius=radius_feature,
-            max_nn=self.max_nn_feature
-        )
         fpfh = o3d.pipelines.registration.compute_fpfh_feature(
             point_cloud,
-            kdTreeSearchParams
+            self._feature_search_param
         )
 
+        FgrFitter._cache_put(self._fpfh_cache, key, point_cloud, fpfh)
         return fpfh
+
+    def _downsample(self, point_cloud: "o3d.geometry.PointCloud") -> "o3d.geometry.PointCloud":
+        """
+        Voxel-downsample a cloud to the FGR resolution, once per cloud.
+
+        Args:
+            point_cloud: Open3D point cloud
+
+        Returns:
+            Downsampled point cloud (cached while the input is alive)
+        """
+        key = (id(point_cloud), self.voxel_size)
+        cached = self._downsample_cache.get(key)
+        if cached is not None:
+            return cached
+
+        downsampled = point_cloud.voxel_down_sample(self.voxel_size)
+        logger.debug(f"Voxel downsampled {len(point_cloud.points)} -> "
+                     f"{len(downsampled.points)} points (voxel {self.voxel_size})")
+
+        FgrFitter._cache_put(self._downsample_cache, key, point_cloud, downsampled)
+        return downsampled
+
+    @staticmethod
+    def _cache_put(cache: Dict[Tuple, Any], key: Tuple,
+                   point_cloud: "o3d.geometry.PointCloud", value: Any) -> None:
+        """Store value under key until point_cloud is garbage collected."""
+        try:
+            weakref.finalize(point_cloud, cache.pop, key, None)
+        except TypeError:
+            # Not weak-referenceable: an id-keyed entry could go stale
+            return
+        cache[key] = value
+
+    def clear_cache(self) -> None:
+        """Drop all cached downsampled clouds and FPFH features."""
+        self._fpfh_cache.clear()
+        self._downsample_cache.clear()
@@ -1,18 +1,27 @@
 """ICP (Iterative Closest Point) fitter."""
 
 import time
-from typing import TYPE_CHECKING, Optional, Dict, Any
+from typing import TYPE_CHECKING, Optional, Dict, Any, Sequence
 import numpy as np
-import open3d as o3d
 from cascaded_fit.utils.logger import Logger
 from cascaded_fit.utils.config import Config
 from cascaded_fit.utils.exceptions import RegistrationError
+from cascaded_fit.core.transformations import TransformationUtils
 
 if TYPE_CHECKING:
+    import open3d as o3d
     from cascaded_fit.utils.type_hints import Transform4x4
 
 logger = Logger.get(__name__)
 
+# Swap only when the sizes differ by more than this natural-log ratio (~1.65x),
+# so near-equal clouds are not flipped back and forth
+SWAP_LOG_RATIO = 0.5
+
+# Shared default initial guess; read-only so no caller can mutate it in place
+_I4 = np.identity(4)
+_I4.setflags(write=False)
+
 
 class FitResult:
     """Result from point cloud fitting."""
@@ -27,8 +36,11 @@ class FitResult:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
+        # Duck-typed: ndarray and numpy scalars/matrices all expose tolist()
+        transformation = self.transformation
+        to_list = getattr(transformation, 'tolist', None)
         return {
-            "transformation": self.transformation.tolist() if isinstance(self.transformation, np.ndarray) else self.transformation,
+            "transformation": to_list() if to_list is not None else transformation,
             "inlier_rmse": float(self.inlier_rmse),
             "max_error": float(self.max_error),
             "rmse_threshold": float(self.rmse_threshold),
@@ -43,7 +55,8 @@ class IcpFitter:
                  max_correspondence_distance: Optional[float] = None,
                  relative_fitness: Optional[float] = None,
                  relative_rmse: Optional[float] = None,
-                 max_iteration: Optional[int] = None) -> None:
+                 max_iteration: Optional[int] = None,
+                 distance_scales: Optional[Sequence[float]] = None) -> None:
         """
         Initialize ICP fitter.
 
@@ -53,6 +66,8 @@ class IcpFitter:
             relative_fitness: Relative fitness threshold
             relative_rmse: Relative RMSE threshold
             max_iteration: Maximum iterations
+            distance_scales: Coarse-to-fine multipliers of max_correspondence_distance,
+                one ICP stage each (config icp.distance_scales if None)
         """
         # Load from config if not provided
         config = Config()
@@ -64,11 +79,63 @@ class IcpFitter:
         self.relative_fitness = relative_fitness or icp_config.relative_fitness
         self.relative_rmse = relative_rmse or icp_config.relative_rmse
         self.max_iteration = max_iteration or reg_config.max_iterations
+        self.distance_scales = tuple(distance_scales or icp_config.distance_scales)
+
+        # Open3D is slow to import; defer it until a fitter is actually built
+        import open3d as o3d
+
+        # Criteria are immutable per fitter; build once instead of per ICP run.
+        # Earlier stages of a multi-stage schedule share a split budget; the
+        # final stage always gets the full max_iteration.
+        self._stage_iterations = max(5, self.max_iteration // len(self.distance_scales))
+        self._stage_criteria = o3d.pipelines.registration.ICPConvergenceCriteria(
+            relative_fitness=self.relative_fitness,
+            relative_rmse=self.relative_rmse,
+            max_iteration=self._stage_iterations
+        )
+        self._criteria = o3d.pipelines.registration.ICPConvergenceCriteria(
+            relative_fitness=self.relative_fitness,
+            relative_rmse=self.relative_rmse,
+            max_iteration=self.max_iteration
+        )
+
+        # Set by prepare(): a target kept resident as an Open3D tensor cloud
+        self._prepared_target: Optional["o3d.geometry.PointCloud"] = None
 
         logger.info(f"IcpFitter initialized: threshold={self.rmse_threshold}, max_iter={self.max_iteration}")
 
-    def fit(self, source_cloud: o3d.geometry.PointCloud,
-            target_cloud: o3d.geometry.PointCloud,
+    def prepare(self, target_cloud: "o3d.geometry.PointCloud") -> None:
+        """
+        Keep a device-resident copy of a target that many sources will be fitted to.
+
+        ICP runs against this exact cloud object then use Open3D's tensor
+        pipeline on the cached copy (on CUDA when available) instead of the
+        legacy API, which rebuilds its target structures on every call.
+
+        Args:
+            target_cloud: Target point cloud (Open3D)
+        """
+        import open3d as o3d
+
+        self._device = o3d.core.Device('CUDA:0' if o3d.core.cuda.is_available() else 'CPU:0')
+        self._prepared_target_t = o3d.t.geometry.PointCloud.from_legacy(
+            target_cloud, device=self._device
+        )
+        self._stage_criteria_t = o3d.t.pipelines.registration.ICPConvergenceCriteria(
+            relative_fitness=self.relative_fitness,
+            relative_rmse=self.relative_rmse,
+            max_iteration=self._stage_iterations
+        )
+        self._criteria_t = o3d.t.pipelines.registration.ICPConvergenceCriteria(
+            relative_fitness=self.relative_fitness,
+            relative_rmse=self.relative_rmse,
+            max_iteration=self.max_iteration
+        )
+        self._prepared_target = target_cloud
+        logger.info(f"Prepared ICP target with {len(target_cloud.points)} points on {self._device}")
+
+    def fit(self, source_cloud: "o3d.geometry.PointCloud",
+            target_cloud: "o3d.geometry.PointCloud",
             initial_guess_transformation: Optional[np.ndarray] = None) -> "FitResult":
         """
         Fit source cloud to target cloud using ICP.
@@ -82,18 +149,20 @@ class IcpFitter:
             FitResult object
         """
         if initial_guess_transformation is None:
-            initial_guess_transformation = np.identity(4)
+            initial_guess_transformation = _I4
 
         self.source_cloud = source_cloud
         self.target_cloud = target_cloud
         self.initial_guess_transformation = initial_guess_transformation
 
-        # Check if we should swap for efficiency
-        source_size = len(np.asarray(source_cloud.points))
-        target_size = len(np.asarray(target_cloud.points))
+        # ICP builds its KD-Tree on the target once and queries it for every
+        # source point on every iteration, so query with the smaller cloud
+        source_size = len(source_cloud.points)
+        target_size = len(target_cloud.points)
 
-        if source_size > target_size:
-            logger.warning(f"Source cloud ({source_size} pts) larger than target ({target_size} pts), swapping for efficiency")
+        if np.log(max(source_size, 1) / max(target_size, 1)) > SWAP_LOG_RATIO:
+            logger.warning(f"Source cloud ({source_size} pts) much larger than target ({target_size} pts), "
+                           f"swapping so the tree is built on the larger cloud")
             # Swap and invert transformation
             result = self._fit_swapped()
             return result
@@ -109,9 +178,11 @@ class IcpFitter:
 
     def _fit_swapped(self) -> "FitResult":
         """Fit with swapped source and target."""
-        initial_inv = np.linalg.inv(self.initial_guess_transformation)
+        initial_inv = TransformationUtils.invert_rigid(
+            np.asarray(self.initial_guess_transformation, dtype=np.float64)
+        )
         result = self._execute_icp(self.target_cloud, self.source_cloud, initial_inv)
-        result.transformation = np.linalg.inv(result.transformation)
+        result.transformation = TransformationUtils.invert_rigid(result.transformation)
         return result
 
     def forward_icp(self) -> "FitResult":
@@ -124,32 +195,62 @@ class IcpFitter:
     def reverse_icp(self) -> "FitResult":
         """Execute reverse ICP."""
         logger.info("Trying reverse ICP fit...")
-        initial_guess_transformation_reversed = np.linalg.inv(self.initial_guess_transformation)
+        initial_guess_transformation_reversed = TransformationUtils.invert_rigid(
+            np.asarray(self.initial_guess_transformation, dtype=np.float64)
+        )
         result = self._execute_icp(self.target_cloud, self.source_cloud,
                                    initial_guess_transformation_reversed)
-        result.transformation = np.linalg.inv(result.transformation)
+        result.transformation = TransformationUtils.invert_rigid(result.transformation)
         return result
 
-    def _execute_icp(self, source_cloud: o3d.geometry.PointCloud,
-                     target_cloud: o3d.geometry.PointCloud,
+    def _execute_icp(self, source_cloud: "o3d.geometry.PointCloud",
+                     target_cloud: "o3d.geometry.PointCloud",
                      initial_guess_transformation: np.ndarray) -> "FitResult":
-        """Execute ICP registration."""
+        """
+        Execute ICP registration over the correspondence-distance schedule.
+
+        Early stages use a wide radius to pull in a coarse misalignment; later
+        stages tighten it, so their nearest-neighbour searches are cheaper.
+        Stops early once a stage run at the configured distance (scale 1.0)
+        meets the RMSE threshold.
+        """
+        import open3d as o3d
+
         start_time = time.time()
 
         try:
-            criteria = o3d.pipelines.registration.ICPConvergenceCriteria(
-                relative_fitness=self.relative_fitness,
-                relative_rmse=self.relative_rmse,
-                max_iteration=self.max_iteration
-            )
-
-            registration_icp = o3d.pipelines.registration.registration_icp(
-                source_cloud,
-                target_cloud,
-                max_correspondence_distance=self.max_correspondence_distance,
-                init=initial_guess_transformation,
-                criteria=criteria
-            )
+            use_prepared = target_cloud is self._prepared_target
+            if use_prepared:
+                source_t = o3d.t.geometry.PointCloud.from_legacy(source_cloud, device=self._device)
+
+            transformation = initial_guess_transformation
+            last_stage = len(self.distance_scales) - 1
+            for stage, scale in enumerate(self.distance_scales):
+                distance = self.max_correspondence_distance * scale
+                final = stage == last_stage
+                if use_prepared:
+                    registration_icp = o3d.t.pipelines.registration.icp(
+                        source_t,
+                        self._prepared_target_t,
+                        distance,
+                        init_source_to_target=o3d.core.Tensor(np.asarray(transformation, dtype=np.float64)),
+                        criteria=self._criteria_t if final else self._stage_criteria_t
+                    )
+                    transformation = registration_icp.transformation.numpy()
+                else:
+                    registration_icp = o3d.pipelines.registration.registration_icp(
+                        source_cloud,
+                        target_cloud,
+                        max_correspondence_distance=distance,
+                        init=transformation,
+                        criteria=self._criteria if final else self._stage_criteria
+                    )
+                    transformation = registration_icp.transformation
+                logger.debug(f"ICP stage x{scale}: RMSE {registration_icp.inlier_rmse:.6f}")
+                # Only an RMSE measured at the configured distance is comparable
+                # to the threshold; a wider coarse radius admits looser pairs.
+                if scale == 1.0 and registration_icp.inlier_rmse < self.rmse_threshold:
+                    break
 
             icp_time = time.time() - start_time
 
@@ -163,7 +264,7 @@ class IcpFitter:
             max_error = registration_icp.inlier_rmse * MAX_ERROR_FACTOR
 
             result = FitResult(
-                registration_icp.transformation,
+                transformation,
                 registration_icp.inlier_rmse,
                 self.rmse_threshold,
                 max_error
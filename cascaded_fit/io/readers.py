@@ -1,13 +1,15 @@
 """Point cloud file readers."""
 
 import os
+import logging
 import numpy as np
-import open3d as o3d
-from pathlib import Path
-from typing import Tuple, Optional
+from typing import TYPE_CHECKING, Tuple, Optional
 from cascaded_fit.utils.logger import Logger
 from cascaded_fit.utils.exceptions import PointCloudLoadError
 
+if TYPE_CHECKING:
+    import open3d as o3d
+
 logger = Logger.get(__name__)
 
 
@@ -15,7 +17,7 @@ class PointCloudReader:
     """Read point cloud files in various formats."""
 
     @staticmethod
-    def read_point_cloud_file(file_path: str) -> o3d.geometry.PointCloud:
+    def read_point_cloud_file(file_path: str) -> "o3d.geometry.PointCloud":
         """
         Read point cloud from file (CSV or PLY).
 
@@ -28,19 +30,28 @@ class PointCloudReader:
         Raises:
             PointCloudLoadError: If file cannot be loaded
         """
+        # Open3D is slow to import; defer it until a cloud is actually read
+        import open3d as o3d
+
         logger.info(f"Reading point cloud from {file_path}")
 
         try:
             extension = os.path.splitext(file_path)[1].lower()
 
             if extension == '.csv':
-                ply_filepath = PointCloudReader._convert_csv_to_ply(file_path)
+                # Parse straight into an array; no intermediate PLY file
+                points = PointCloudReader._load_csv_points(file_path, dtype=np.float64)
             elif extension == '.ply':
-                ply_filepath = file_path
+                points = PointCloudReader._memmap_xyz_ply(file_path)
+                if points is not None:
+                    points = points.astype(np.float64)
             else:
                 raise PointCloudLoadError(f'Unsupported file format: {extension}')
 
-            point_cloud = o3d.io.read_point_cloud(ply_filepath)
+            if points is not None:
+                point_cloud = PointCloudReader.cloud_from_array(points)
+            else:
+                point_cloud = o3d.io.read_point_cloud(file_path)
 
             if len(point_cloud.points) == 0:
                 raise PointCloudLoadError(f"No points loaded from {file_path}")
@@ -53,57 +64,108 @@ class PointCloudReader:
             raise PointCloudLoadError(f"Failed to read {file_path}: {e}")
 
     @staticmethod
-    def _convert_csv_to_ply(csv_filename: str) -> str:
+    def cloud_from_array(points: np.ndarray) -> "o3d.geometry.PointCloud":
         """
-        Convert CSV to PLY format.
+        Build an Open3D point cloud from an in-memory array.
 
         Args:
-            csv_filename: Path to CSV file
+            points: Nx3 numpy array of points
 
         Returns:
-            Path to generated PLY file
+            open3d.geometry.PointCloud object
         """
-        logger.debug(f"Converting CSV to PLY: {csv_filename}")
+        import open3d as o3d
 
-        with open(csv_filename, 'r') as csv_file:
-            csv_content = csv_file.read()
+        point_cloud = o3d.geometry.PointCloud()
+        point_cloud.points = o3d.utility.Vector3dVector(
+            np.asarray(points, dtype=np.float64)
+        )
+        return point_cloud
 
-        ply_content = csv_content.replace(',', ' ')
-        ply_content = ply_content.rstrip("\n")
-        point_count = ply_content.count('\n')
+    @staticmethod
+    def _load_csv_points(csv_filename: str, dtype: type = np.float32) -> np.ndarray:
+        """
+        Parse the x, y, z columns of a CSV file into an Nx3 array.
 
-        header = f"""ply
-format ascii 1.0
-comment PYTHON generated
-element vertex {point_count}
-property float x
-property float y
-property float z
-end_header
-"""
+        Args:
+            csv_filename: Path to CSV file
+            dtype: Floating point type of the result
 
-        ply_content = header + ply_content
+        Returns:
+            Nx3 numpy array of points
+        """
+        return np.loadtxt(csv_filename, delimiter=',', dtype=dtype,
+                          usecols=(0, 1, 2), ndmin=2)
 
-        ply_filename = csv_filename.replace('.csv', '.ply')
-        with open(ply_filename, 'w') as ply_file:
-            ply_file.write(ply_content)
+    @staticmethod
+    def _memmap_xyz_ply(ply_filename: str) -> Optional[np.ndarray]:
+        """
+        Memory-map a binary little-endian PLY holding only float x/y/z vertices.
+
+        The payload is paged in by the OS instead of being read into memory
+        up front, which keeps RSS bounded for multi-GB captures.
+
+        Args:
+            ply_filename: Path to PLY file
 
-        logger.debug(f"Created PLY file: {ply_filename}")
-        return ply_filename
+        Returns:
+            Read-only Nx3 float32 memmap, or None if the file has any other layout
+        """
+        header_lines = []
+        with open(ply_filename, 'rb') as ply_file:
+            if ply_file.readline().strip() != b'ply':
+                return None
+            while True:
+                line = ply_file.readline()
+                if not line:
+                    return None
+                line = line.strip()
+                if line == b'end_header':
+                    break
+                if line and not line.startswith(b'comment'):
+                    header_lines.append(line.split())
+            header_end = ply_file.tell()
+
+        if not header_lines or header_lines[0] != [b'format', b'binary_little_endian', b'1.0']:
+            return None
+        if len(header_lines) != 5 or header_lines[1][:2] != [b'element', b'vertex']:
+            return None
+        properties = header_lines[2:]
+        for prop, axis in zip(properties, (b'x', b'y', b'z')):
+            if prop[0] != b'property' or prop[1:] not in ([b'float', axis], [b'float32', axis]):
+                return None
+
+        point_count = int(header_lines[1][2])
+        if point_count == 0:
+            return np.empty((0, 3), dtype='<f4')
+
+        logger.debug(f"Memory-mapping {point_count} points from {ply_filename}")
+        return np.memmap(ply_filename, dtype='<f4', mode='r',
+                         offset=header_end, shape=(point_count, 3))
 
     @staticmethod
     def load_ply(file_path: str) -> Tuple[np.ndarray, Optional[np.ndarray]]:
         """
         Load PLY file and return numpy arrays.
 
+        Binary little-endian xyz-only files are read through a memory map
+        instead of Open3D's parser; anything else is parsed by Open3D.
+
         Args:
             file_path: Path to PLY file
 
         Returns:
-            Tuple of (points, normals) as numpy arrays
+            Tuple of (points, normals) as writable float64 numpy arrays
         """
         logger.debug(f"Loading PLY as numpy: {file_path}")
 
+        points = PointCloudReader._memmap_xyz_ply(file_path)
+        if points is not None:
+            # Copy out of the read-only float32 map so both paths return the same type
+            return np.array(points, dtype=np.float64), None
+
+        import open3d as o3d
+
         pcd = o3d.io.read_point_cloud(file_path)
         points = np.asarray(pcd.points)
         normals = np.asarray(pcd.normals) if pcd.has_normals() else None
@@ -124,6 +186,8 @@ end_header
             Tuple of (source_points, target_points) with equal number of points
         """
         min_size = min(len(source_points), len(target_points))
-        if len(source_points) != len(target_points):
+        # Skip formatting the message on the request path unless it will be emitted
+        if len(source_points) != len(target_points) and logger.isEnabledFor(logging.DEBUG):
             logger.debug(f"Aligning cloud sizes: {len(source_points)} and {len(target_points)} -> {min_size}")
+        # Basic slices are views; no copy is made
         return source_points[:min_size], target_points[:min_size]
@@ -1,21 +1,30 @@
 """Configuration management using YAML files."""
 
+import copy
 import yaml
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional, Tuple
 from dataclasses import dataclass
 from cascaded_fit.utils.exceptions import ConfigurationError
 
+# Parsed config files kept by Config.load; the oldest is evicted beyond this
+LOAD_CACHE_SIZE = 8
 
-@dataclass
+
+@dataclass(frozen=True)
 class ICPConfig:
     """ICP algorithm configuration."""
     max_correspondence_distance: float
     relative_fitness: float
     relative_rmse: float
+    distance_scales: Tuple[float, ...] = (1.0,)
+
+    def __post_init__(self):
+        # YAML yields a list; store a tuple so the shared instance stays immutable
+        object.__setattr__(self, 'distance_scales', tuple(self.distance_scales))
 
 
-@dataclass
+@dataclass(frozen=True)
 class FGRConfig:
     """FGR algorithm configuration."""
     distance_threshold: float
@@ -27,15 +36,23 @@ class FGRConfig:
     max_nn_feature: int = 100
 
 
-@dataclass
+@dataclass(frozen=True)
 class RegistrationConfig:
     """Overall registration configuration."""
     rmse_threshold: float
     max_iterations: int
     tolerance: float
+    nn_backend: str = "cpu"
+
 
+@dataclass(frozen=True)
+class MetricsConfig:
+    """Registration metrics configuration."""
+    sample_size: int = 100000
+    exact_max_error: bool = True
 
-@dataclass
+
+@dataclass(frozen=True)
 class APIConfig:
     """REST API configuration."""
     host: str
@@ -45,6 +62,8 @@ class APIConfig:
     timeout: int
     rmse_threshold: float
     enable_bidirectional: bool
+    early_exit_factor: float = 0.5
+    parallel_bidirectional: bool = False
 
 
 class Config:
@@ -52,6 +71,9 @@ class Config:
 
     _instance = None
     _config: Dict[str, Any] = {}
+    _typed_configs: Dict[str, Any] = {}
+    _typed_configs_source: Optional[Dict[str, Any]] = None
+    _load_cache: Dict[Tuple[str, int, int], Dict[str, Any]] = {}
 
     def __new__(cls):
         if cls._instance is None:
@@ -61,6 +83,11 @@ class Config:
     @classmethod
     def load(cls, config_path: Optional[str] = None) -> "Config":
         """Load configuration from YAML file.
+
+        Parsed files are cached by (path, mtime, size), so reloading an
+        unchanged file skips the YAML parse. Each load gets its own copy of
+        the cached dict, so changes to one loaded config never leak into the
+        next.
         
         Args:
             config_path: Optional path to configuration file. If None, loads default.yaml
@@ -81,6 +108,13 @@ class Config:
         if not config_path.exists():
             raise FileNotFoundError(f"Configuration file not found: {config_path}")
 
+        stat = config_path.stat()
+        cache_key = (str(config_path.resolve()), stat.st_mtime_ns, stat.st_size)
+        cached = cls._load_cache.get(cache_key)
+        if cached is not None:
+            cls._config = copy.deepcopy(cached)
+            return cls._instance
+
         try:
             with open(config_path, 'r') as f:
                 cls._config = yaml.safe_load(f)
@@ -90,6 +124,10 @@ class Config:
         except yaml.YAMLError as e:
             raise ConfigurationError(f"Failed to parse YAML configuration: {e}") from e
 
+        if len(cls._load_cache) >= LOAD_CACHE_SIZE:
+            cls._load_cache.pop(next(iter(cls._load_cache)))
+        cls._load_cache[cache_key] = copy.deepcopy(cls._config)
+
         return cls._instance
     
     @classmethod
@@ -103,6 +141,23 @@ class Config:
                 f"Configuration missing required sections: {', '.join(missing)}"
             )
 
+    @classmethod
+    def _typed(cls, section: str, build: Callable[[], Any]) -> Any:
+        """Return the typed config for section, building it once per loaded config.
+
+        Typed configs are rebuilt only when a different config dict is loaded,
+        so fitters constructed per request share the same instances; the
+        dataclasses are frozen so no caller can change them for the others.
+        """
+        if cls._typed_configs_source is not cls._config:
+            cls._typed_configs = {}
+            cls._typed_configs_source = cls._config
+
+        typed = cls._typed_configs.get(section)
+        if typed is None:
+            typed = cls._typed_configs[section] = build()
+        return typed
+
     @classmethod
     def get(cls, key: str, default: Any = None) -> Any:
         """Get configuration value by dot-separated key."""
@@ -138,11 +193,12 @@ class Config:
 
         reg_cfg = cls._config['registration']
 
-        return RegistrationConfig(
+        return cls._typed('registration', lambda: RegistrationConfig(
             rmse_threshold=reg_cfg['rmse_threshold'],
             max_iterations=reg_cfg['max_iterations'],
-            tolerance=reg_cfg['tolerance']
-        )
+            tolerance=reg_cfg['tolerance'],
+            nn_backend=reg_cfg.get('nn_backend', 'cpu')
+        ))
 
     @classmethod
     def get_icp_config(cls) -> ICPConfig:
@@ -163,7 +219,7 @@ class Config:
 
         icp_cfg = cls._config['icp']
 
-        return ICPConfig(**icp_cfg)
+        return cls._typed('icp', lambda: ICPConfig(**icp_cfg))
 
     @classmethod
     def get_fgr_config(cls) -> FGRConfig:
@@ -184,7 +240,7 @@ class Config:
 
         fgr_cfg = cls._config['fgr']
 
-        return FGRConfig(**fgr_cfg)
+        return cls._typed('fgr', lambda: FGRConfig(**fgr_cfg))
 
     @classmethod
     def get_api_config(cls) -> APIConfig:
@@ -203,6 +259,18 @@ class Config:
         if 'api' not in cls._config:
             raise ConfigurationError("Configuration missing 'api' section")
 
-        api_cfg = cls._config['api']
+        return cls._typed('api', lambda: APIConfig(**cls._config['api']))
+
+    @classmethod
+    def get_metrics_config(cls) -> MetricsConfig:
+        """Get typed metrics configuration.
+
+        The metrics section is optional; defaults are used when it is absent.
+
+        Returns:
+            MetricsConfig instance
+        """
+        if not cls._config:
+            cls.load()
 
-        return APIConfig(**api_cfg)
+        return cls._typed('metrics', lambda: MetricsConfig(**cls._config.get('metrics', {})))
@@ -26,6 +26,11 @@ class ConvergenceError(RegistrationError):
     pass
 
 
+class RegistrationCancelledError(RegistrationError):
+    """Registration was stopped by its caller before finishing."""
+    pass
+
+
 class ConfigurationError(CascadedFitError):
     """Invalid configuration."""
     pass
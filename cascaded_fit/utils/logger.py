@@ -9,7 +9,6 @@ from typing import Optional
 class Logger:
     """Logger factory with consistent configuration."""
 
-    _loggers = {}
     _configured = False
 
     @classmethod
@@ -50,9 +49,9 @@ class Logger:
 
     @classmethod
     def get(cls, name: str) -> logging.Logger:
-        """Get logger instance by name."""
-        if name not in cls._loggers:
-            logger = logging.getLogger(name)
-            cls._loggers[name] = logger
+        """Get logger instance by name.
 
-        return cls._loggers[name]
+        logging.getLogger already returns one shared instance per name, so no
+        separate cache is kept here.
+        """
+        return logging.getLogger(name)
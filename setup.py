@@ -25,6 +25,14 @@ setup(
     packages=find_packages(exclude=["tests", "tests.*", "scripts", "docs"]),
     install_requires=requirements,
     extras_require={
+        "api": [
+            "orjson>=3.8.0",
+            "pyarrow>=12.0.0",
+            "waitress>=2.1.0",
+        ],
+        "knn": [
+            "pykdtree>=1.3.7",
+        ],
         "dev": [
             "pytest>=7.4.0",
             "pytest-cov>=4.1.0",
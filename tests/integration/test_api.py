@@ -2,8 +2,11 @@
 
 import pytest
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from flask import Flask
+from unittest.mock import patch
 from cascaded_fit.api.app import app, api_handler
+from cascaded_fit.utils.exceptions import RegistrationError
 
 
 @pytest.fixture
@@ -96,6 +99,39 @@ class TestProcessPointCloudsEndpoint:
         assert isinstance(data['inlier_rmse'], (int, float))
         assert data['inlier_rmse'] >= 0
 
+    def test_json_points_stay_float64(self, client, sample_point_clouds):
+        """Test JSON point lists reach registration as float64 arrays."""
+        source_points, target_points = sample_point_clouds
+        result = {'transformation': np.eye(4).tolist(), 'inlier_rmse': 0.0,
+                  'max_error': 0.0, 'is_success': True, 'method': 'Forward Custom ICP'}
+
+        with patch.object(api_handler, 'process_point_clouds',
+                          return_value=result) as mock_process:
+            response = client.post('/process_point_clouds', json={
+                'source_points': source_points,
+                'target_points': target_points
+            })
+
+        assert response.status_code == 200
+        source, target = mock_process.call_args[0]
+        assert source.dtype == np.float64
+        assert target.dtype == np.float64
+
+    def test_offset_clouds_register_with_custom_icp(self, client, sample_point_clouds):
+        """Test clouds far from the origin are registered by custom PCA + ICP."""
+        source_points, target_points = sample_point_clouds
+        offset = np.array([5000.0, 40.0, 1000.0])
+
+        response = client.post('/process_point_clouds', json={
+            'source_points': (np.array(source_points) + offset).tolist(),
+            'target_points': (np.array(target_points) + offset).tolist()
+        })
+
+        data = response.get_json()
+        assert response.status_code == 200
+        assert data['method'].endswith('Custom ICP')
+        assert data['inlier_rmse'] < 1e-6
+
     def test_empty_point_clouds(self, client):
         """Test endpoint with empty point clouds."""
         response = client.post('/process_point_clouds', json={
@@ -162,19 +198,125 @@ class TestProcessPointCloudsEndpoint:
             assert 'transformation' in data
 
 
+class TestArrowRequests:
+    """Test Arrow IPC request bodies."""
+
+    @staticmethod
+    def _arrow_body(source, target):
+        pa = pytest.importorskip("pyarrow")
+        length = max(len(source), len(target))
+
+        def column(points):
+            values = pa.array(np.asarray(points, dtype=np.float32).ravel())
+            array = pa.FixedSizeListArray.from_arrays(values, 3)
+            return pa.concat_arrays([array, pa.nulls(length - len(points), array.type)])
+
+        batch = pa.record_batch(
+            [column(source), column(target)],
+            names=['source_points', 'target_points']
+        )
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, batch.schema) as writer:
+            writer.write_batch(batch)
+        return sink.getvalue().to_pybytes()
+
+    def test_valid_arrow_request(self, client, sample_point_clouds):
+        """Test endpoint accepts an Arrow stream body."""
+        source_points, target_points = sample_point_clouds
+        body = self._arrow_body(source_points, target_points)
+
+        response = client.post(
+            '/process_point_clouds',
+            data=body,
+            content_type='application/vnd.apache.arrow.stream'
+        )
+
+        assert response.status_code == 200
+        data = response.get_json()
+        assert np.array(data['transformation']).shape == (4, 4)
+
+    def test_arrow_points_upcast_to_float64(self, client, sample_point_clouds):
+        """Test float32 Arrow columns reach registration as float64 arrays."""
+        source_points, target_points = sample_point_clouds
+        body = self._arrow_body(source_points, target_points)
+        result = {'transformation': np.eye(4).tolist(), 'inlier_rmse': 0.0,
+                  'max_error': 0.0, 'is_success': True, 'method': 'Forward Custom ICP'}
+
+        with patch.object(api_handler, 'process_point_clouds',
+                          return_value=result) as mock_process:
+            client.post(
+                '/process_point_clouds',
+                data=body,
+                content_type='application/vnd.apache.arrow.stream'
+            )
+
+        source, target = mock_process.call_args[0]
+        assert source.dtype == np.float64
+        assert target.dtype == np.float64
+
+    def test_arrow_request_missing_column(self, client):
+        """Test Arrow stream without target_points is rejected."""
+        pa = pytest.importorskip("pyarrow")
+        values = pa.array(np.zeros(300, dtype=np.float32))
+        batch = pa.record_batch(
+            [pa.FixedSizeListArray.from_arrays(values, 3)],
+            names=['source_points']
+        )
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, batch.schema) as writer:
+            writer.write_batch(batch)
+
+        response = client.post(
+            '/process_point_clouds',
+            data=sink.getvalue().to_pybytes(),
+            content_type='application/vnd.apache.arrow.stream'
+        )
+
+        assert response.status_code == 400
+        assert 'target_points' in response.get_json()['error']
+
+    def test_arrow_request_malformed_stream(self, client):
+        """Test a body that is not an Arrow stream is rejected as bad input."""
+        pytest.importorskip("pyarrow")
+
+        response = client.post(
+            '/process_point_clouds',
+            data=b'not an arrow stream',
+            content_type='application/vnd.apache.arrow.stream'
+        )
+
+        assert response.status_code == 400
+
+    def test_arrow_request_interior_null(self, client, sample_point_clouds):
+        """Test a null before the last point is rejected rather than dropped."""
+        pa = pytest.importorskip("pyarrow")
+        source_points, target_points = sample_point_clouds
+        values = pa.array(np.asarray(source_points, dtype=np.float32).ravel())
+        points = pa.FixedSizeListArray.from_arrays(values, 3)
+        source = pa.concat_arrays([
+            points.slice(0, 50), pa.nulls(1, points.type), points.slice(51)
+        ])
+        target = pa.FixedSizeListArray.from_arrays(
+            pa.array(np.asarray(target_points, dtype=np.float32).ravel()), 3
+        )
+        batch = pa.record_batch([source, target], names=['source_points', 'target_points'])
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, batch.schema) as writer:
+            writer.write_batch(batch)
+
+        response = client.post(
+            '/process_point_clouds',
+            data=sink.getvalue().to_pybytes(),
+            content_type='application/vnd.apache.arrow.stream'
+        )
+
+        assert response.status_code == 400
+        assert 'null' in response.get_json()['error']
+
+
 class TestAPIHandler:
     """Test API handler class directly."""
 
-    def test_align_cloud_sizes(self):
-        """Test cloud size alignment."""
-        source = np.array([[1, 2, 3], [4, 5, 6], [7, 8, 9]])
-        target = np.array([[10, 11, 12], [13, 14, 15]])
-        
-        aligned_source, aligned_target = api_handler.align_cloud_sizes(source, target)
-        
-        assert len(aligned_source) == len(aligned_target)
-        assert len(aligned_source) == 2  # Minimum size
-
     def test_process_point_clouds_success(self, sample_point_clouds):
         """Test successful point cloud processing."""
         source_points, target_points = sample_point_clouds
@@ -204,3 +346,101 @@ class TestAPIHandler:
                 np.array([]).reshape(0, 3)
             )
 
+    def test_reverse_skipped_when_forward_clearly_passes(self, sample_point_clouds):
+        """Test reverse registration is skipped after a clearly good forward pass."""
+        source_points, target_points = sample_point_clouds
+        forward = (np.eye(4), 0.0, 0.0, "Custom ICP")
+
+        with patch.object(api_handler, 'register_with_fallback',
+                          return_value=forward) as mock_register:
+            result = api_handler.process_point_clouds(
+                np.array(source_points), np.array(target_points)
+            )
+
+        assert mock_register.call_count == 1
+        assert result['method'] == "Forward Custom ICP"
+
+    def test_unequal_clouds_not_truncated(self, sample_point_clouds):
+        """Test clouds of different sizes are registered at full size."""
+        source_points, target_points = sample_point_clouds
+        source = np.array(source_points)
+        target = np.vstack((np.array(target_points), np.random.rand(20, 3)))
+        forward = (np.eye(4), 0.0, 0.0, "Custom ICP")
+
+        with patch.object(api_handler, 'register_with_fallback',
+                          return_value=forward) as mock_register:
+            api_handler.process_point_clouds(source, target)
+
+        registered_source, registered_target = mock_register.call_args[0]
+        assert len(registered_source) == 100
+        assert len(registered_target) == 120
+
+    def test_reverse_runs_when_forward_marginal(self, sample_point_clouds):
+        """Test reverse registration still runs when forward RMSE is marginal."""
+        source_points, target_points = sample_point_clouds
+        marginal_rmse = api_handler.rmse_threshold * 0.9
+        forward = (np.eye(4), marginal_rmse, marginal_rmse, "Custom ICP")
+
+        with patch.object(api_handler, 'register_with_fallback',
+                          return_value=forward) as mock_register:
+            api_handler.process_point_clouds(
+                np.array(source_points), np.array(target_points)
+            )
+
+        assert mock_register.call_count == 2
+
+    def test_parallel_reverse_stopped_when_forward_clearly_passes(self, sample_point_clouds):
+        """Test the in-flight reverse pass is told to stop after a clear forward pass."""
+        source_points, target_points = sample_point_clouds
+        forward = (np.eye(4), 0.0, 0.0, "Custom ICP")
+
+        with ThreadPoolExecutor(max_workers=1) as executor, \
+                patch.object(api_handler, '_executor', executor), \
+                patch.object(api_handler, 'register_with_fallback',
+                             return_value=forward) as mock_register:
+            result = api_handler.process_point_clouds(
+                np.array(source_points), np.array(target_points)
+            )
+
+        reverse_call = next(call for call in mock_register.call_args_list if len(call[0]) == 3)
+        assert reverse_call[0][2].is_set()
+        assert result['method'] == "Forward Custom ICP"
+
+    def test_parallel_reverse_runs_alongside_forward(self, sample_point_clouds):
+        """Test reverse registration is submitted to the executor when enabled."""
+        source_points, target_points = sample_point_clouds
+        marginal_rmse = api_handler.rmse_threshold * 0.9
+        forward = (np.eye(4), marginal_rmse, marginal_rmse, "Custom ICP")
+
+        with ThreadPoolExecutor(max_workers=1) as executor, \
+                patch.object(api_handler, '_executor', executor), \
+                patch.object(api_handler, 'register_with_fallback',
+                             return_value=forward) as mock_register:
+            result = api_handler.process_point_clouds(
+                np.array(source_points), np.array(target_points)
+            )
+
+        assert mock_register.call_count == 2
+        assert result['is_success']
+
+    def test_parallel_reverse_stopped_when_forward_fails(self, sample_point_clouds):
+        """Test the in-flight reverse pass is told to stop if the forward pass raises."""
+        source_points, target_points = sample_point_clouds
+        stop_events = []
+
+        def register(source, target, stop_event=None):
+            if stop_event is None:
+                raise RegistrationError("forward failed")
+            stop_events.append(stop_event)
+            return (np.eye(4), 0.0, 0.0, "Custom ICP")
+
+        with ThreadPoolExecutor(max_workers=1) as executor, \
+                patch.object(api_handler, '_executor', executor), \
+                patch.object(api_handler, 'register_with_fallback', side_effect=register):
+            with pytest.raises(RegistrationError):
+                api_handler.process_point_clouds(
+                    np.array(source_points), np.array(target_points)
+                )
+
+        assert len(stop_events) == 1
+        assert stop_events[0].is_set()
@@ -72,8 +72,7 @@ class TestCLI:
         assert args.rmse_threshold == 0.001
 
     @patch('cascaded_fit.cli.main.CascadedFitter')
-    @patch('cascaded_fit.cli.main.PointCloudReader')
-    def test_run_success(self, mock_reader, mock_fitter_class):
+    def test_run_success(self, mock_fitter_class):
         """Test successful CLI run."""
         # Setup mocks
         mock_fitter = MagicMock()
@@ -140,6 +140,20 @@ class TestCascadedFitterRun:
         with pytest.raises(RegistrationError):
             fitter.run('nonexistent.ply', 'target.ply')
 
+    @patch('cascaded_fit.fitters.cascaded_fitter.PointCloudReader')
+    def test_run_from_clouds(self, mock_reader, sample_point_clouds, mock_fit_result):
+        """Test in-memory clouds are registered without touching the reader."""
+        source_cloud, target_cloud = sample_point_clouds
+
+        fitter = CascadedFitter()
+        fitter.icp_fitter.fit = Mock(return_value=mock_fit_result)
+
+        result = fitter.run_from_clouds(source_cloud, target_cloud)
+
+        mock_reader.read_point_cloud_file.assert_not_called()
+        fitter.icp_fitter.fit.assert_called_once_with(source_cloud, target_cloud)
+        assert result['is_success'] is True
+
 
 class TestCascadedFitterHelpers:
     """Test CascadedFitter helper methods."""
@@ -197,7 +211,7 @@ class TestCascadedFitterHelpers:
         result = fitter._try_fgr_fit()
         assert result is mock_fit_result
 
-    @patch('cascaded_fit.fitters.cascaded_fitter.o3d.visualization.draw_geometries')
+    @patch('open3d.visualization.draw_geometries')
     def test_visualize_results(self, mock_draw, sample_point_clouds, mock_fit_result):
         """Test _visualize_results method."""
         source_cloud, target_cloud = sample_point_clouds
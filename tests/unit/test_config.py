@@ -2,9 +2,12 @@
 
 import pytest
 import yaml
+from dataclasses import FrozenInstanceError
 from pathlib import Path
 from unittest.mock import patch, mock_open
-from cascaded_fit.utils.config import Config, ICPConfig, FGRConfig, RegistrationConfig, APIConfig
+from cascaded_fit.utils.config import (
+    Config, ICPConfig, FGRConfig, RegistrationConfig, APIConfig, LOAD_CACHE_SIZE
+)
 from cascaded_fit.utils.exceptions import ConfigurationError
 
 
@@ -66,6 +69,70 @@ class TestConfig:
         
         assert Config._config['registration']['rmse_threshold'] == 0.001
 
+    def test_typed_configs_are_cached_until_reload(self, tmp_path):
+        """Test typed getters reuse their result until another config is loaded."""
+        Config._config = {}
+        config = Config()
+        config.load()
+
+        getters = [config.get_registration_config, config.get_icp_config,
+                   config.get_fgr_config, config.get_api_config,
+                   config.get_metrics_config]
+        first = [getter() for getter in getters]
+        for getter, typed in zip(getters, first):
+            assert getter() is typed
+
+        custom_file = tmp_path / "custom.yaml"
+        custom_file.write_text(yaml.dump(Config._config))
+        config.load(str(custom_file))
+        for getter, typed in zip(getters, first):
+            assert getter() is not typed
+
+    def test_typed_configs_are_immutable(self):
+        """Test shared typed configs cannot be changed by one caller."""
+        Config._config = {}
+        config = Config()
+        config.load()
+
+        with pytest.raises(FrozenInstanceError):
+            config.get_registration_config().rmse_threshold = 1.0
+        assert isinstance(config.get_icp_config().distance_scales, tuple)
+
+    def test_load_reuses_parsed_file(self):
+        """Test reloading an unchanged file skips the YAML parse."""
+        config = Config()
+        config.load()
+
+        with patch('cascaded_fit.utils.config.yaml.safe_load') as mock_safe_load:
+            config.load()
+
+        mock_safe_load.assert_not_called()
+        assert 'registration' in Config._config
+
+    def test_load_cache_returns_independent_copies(self):
+        """Test changes to a loaded config do not leak into the next load."""
+        config = Config()
+        config.load()
+        original = Config._config['registration']['rmse_threshold']
+
+        Config._config['registration']['rmse_threshold'] = -1.0
+        config.load()
+
+        assert Config._config['registration']['rmse_threshold'] == original
+
+    def test_load_cache_is_bounded(self, tmp_path):
+        """Test the parsed-file cache evicts old entries."""
+        config = Config()
+        config.load()
+        default_yaml = yaml.dump(Config._config)
+
+        for i in range(LOAD_CACHE_SIZE + 2):
+            config_file = tmp_path / f"config_{i}.yaml"
+            config_file.write_text(default_yaml)
+            config.load(str(config_file))
+
+        assert len(Config._load_cache) == LOAD_CACHE_SIZE
+
     def test_load_nonexistent_file(self):
         """Test loading nonexistent configuration file."""
         Config._config = {}
@@ -53,7 +53,7 @@ class TestFgrFitterInitialization:
 class TestFgrFitterFit:
     """Test FgrFitter.fit() method."""
 
-    @patch('cascaded_fit.fitters.fgr_fitter.o3d.pipelines.registration.registration_fgr_based_on_feature_matching')
+    @patch('open3d.pipelines.registration.registration_fgr_based_on_feature_matching')
     def test_fit_success_with_icp(self, mock_fgr, sample_point_clouds):
         """Test successful fit with ICP refinement."""
         source_cloud, target_cloud = sample_point_clouds
@@ -81,7 +81,29 @@ class TestFgrFitterFit:
         assert result.is_success is True
         assert icp_fitter.fit.called
 
-    @patch('cascaded_fit.fitters.fgr_fitter.o3d.pipelines.registration.registration_fgr_based_on_feature_matching')
+    @patch('open3d.pipelines.registration.registration_fgr_based_on_feature_matching')
+    def test_fit_fgr_downsampled_icp_full(self, mock_fgr, sample_point_clouds):
+        """Test FGR sees downsampled clouds while ICP refines the originals."""
+        source_cloud, target_cloud = sample_point_clouds
+
+        mock_fgr_result = Mock()
+        mock_fgr_result.transformation = np.eye(4)
+        mock_fgr.return_value = mock_fgr_result
+        icp_fitter = Mock()
+
+        fitter = FgrFitter(voxel_size=2.0, icp_fitter=icp_fitter)
+        fitter.fit(source_cloud, target_cloud)
+
+        fgr_source = mock_fgr.call_args[0][0]
+        assert len(fgr_source.points) < len(source_cloud.points)
+        assert icp_fitter.fit.call_args[0][0] is source_cloud
+        assert icp_fitter.fit.call_args[0][1] is target_cloud
+
+        # Second fit reuses the cached downsampled clouds
+        fitter.fit(source_cloud, target_cloud)
+        assert mock_fgr.call_args[0][0] is fgr_source
+
+    @patch('open3d.pipelines.registration.registration_fgr_based_on_feature_matching')
     def test_fit_without_icp_fitter(self, mock_fgr, sample_point_clouds):
         """Test fit without ICP fitter (returns FGR result only)."""
         source_cloud, target_cloud = sample_point_clouds
@@ -96,7 +118,7 @@ class TestFgrFitterFit:
         assert result is not None
         assert result.inlier_rmse == 0.0  # FGR doesn't provide RMSE
 
-    @patch('cascaded_fit.fitters.fgr_fitter.o3d.pipelines.registration.registration_fgr_based_on_feature_matching')
+    @patch('open3d.pipelines.registration.registration_fgr_based_on_feature_matching')
     def test_fit_error_handling(self, mock_fgr, sample_point_clouds):
         """Test fit error handling."""
         source_cloud, target_cloud = sample_point_clouds
@@ -111,8 +133,8 @@ class TestFgrFitterFit:
 class TestFgrFitterHelpers:
     """Test FgrFitter helper methods."""
 
-    @patch('cascaded_fit.fitters.fgr_fitter.o3d.pipelines.registration.compute_fpfh_feature')
-    @patch('cascaded_fit.fitters.fgr_fitter.o3d.geometry.PointCloud.estimate_normals')
+    @patch('open3d.pipelines.registration.compute_fpfh_feature')
+    @patch('open3d.geometry.PointCloud.estimate_normals')
     def test_calculate_fpfh(self, mock_normals, mock_fpfh, sample_point_clouds):
         """Test _calculate_fpfh method."""
         source_cloud, _ = sample_point_clouds
@@ -126,3 +148,19 @@ class TestFgrFitterHelpers:
         mock_normals.assert_called_once()
         mock_fpfh.assert_called_once()
 
+    @patch('open3d.pipelines.registration.compute_fpfh_feature')
+    def test_calculate_fpfh_cached(self, mock_fpfh, sample_point_clouds):
+        """Test FPFH features are computed once per cloud."""
+        source_cloud, _ = sample_point_clouds
+        mock_fpfh.return_value = Mock()
+
+        fitter = FgrFitter(voxel_size=10.0)
+        first = fitter._calculate_fpfh(source_cloud)
+        second = fitter._calculate_fpfh(source_cloud)
+
+        assert first is second
+        mock_fpfh.assert_called_once()
+
+        fitter.clear_cache()
+        fitter._calculate_fpfh(source_cloud)
+        assert mock_fpfh.call_count == 2
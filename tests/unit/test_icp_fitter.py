@@ -48,7 +48,7 @@ class TestIcpFitterInitialization:
 class TestIcpFitterFit:
     """Test IcpFitter.fit() method."""
 
-    @patch('cascaded_fit.fitters.icp_fitter.o3d.pipelines.registration.registration_icp')
+    @patch('open3d.pipelines.registration.registration_icp')
     def test_fit_success_forward(self, mock_icp, sample_point_clouds):
         """Test successful forward ICP fit."""
         source_cloud, target_cloud = sample_point_clouds
@@ -66,7 +66,7 @@ class TestIcpFitterFit:
         assert result.is_success is True
         assert result.inlier_rmse == 0.001
 
-    @patch('cascaded_fit.fitters.icp_fitter.o3d.pipelines.registration.registration_icp')
+    @patch('open3d.pipelines.registration.registration_icp')
     def test_fit_with_initial_guess(self, mock_icp, sample_point_clouds):
         """Test fit with initial transformation guess."""
         source_cloud, target_cloud = sample_point_clouds
@@ -85,7 +85,7 @@ class TestIcpFitterFit:
         
         assert result.is_success is True
 
-    @patch('cascaded_fit.fitters.icp_fitter.o3d.pipelines.registration.registration_icp')
+    @patch('open3d.pipelines.registration.registration_icp')
     def test_fit_swaps_when_source_larger(self, mock_icp, sample_point_clouds):
         """Test fit swaps clouds when source is larger than target."""
         source_cloud, target_cloud = sample_point_clouds
@@ -107,7 +107,26 @@ class TestIcpFitterFit:
         # Should have swapped and inverted transformation
         assert result.is_success is True
 
-    @patch('cascaded_fit.fitters.icp_fitter.o3d.pipelines.registration.registration_icp')
+    @patch('open3d.pipelines.registration.registration_icp')
+    def test_fit_no_swap_for_similar_sizes(self, mock_icp, sample_point_clouds):
+        """Test clouds of similar size are not swapped."""
+        _, target_cloud = sample_point_clouds
+
+        slightly_larger = o3d.geometry.PointCloud()
+        slightly_larger.points = o3d.utility.Vector3dVector(np.random.rand(120, 3) * 10.0)
+
+        mock_result = Mock()
+        mock_result.transformation = np.eye(4)
+        mock_result.inlier_rmse = 0.001
+        mock_result.fitness = 0.99
+        mock_icp.return_value = mock_result
+
+        fitter = IcpFitter()
+        fitter.fit(slightly_larger, target_cloud)
+
+        assert mock_icp.call_args[0][0] is slightly_larger
+
+    @patch('open3d.pipelines.registration.registration_icp')
     def test_fit_forward_then_reverse(self, mock_icp, sample_point_clouds):
         """Test fit tries forward then reverse if forward fails."""
         source_cloud, target_cloud = sample_point_clouds
@@ -125,13 +144,72 @@ class TestIcpFitterFit:
         
         mock_icp.side_effect = [failed_result, success_result]
         
-        fitter = IcpFitter(rmse_threshold=0.01)
+        fitter = IcpFitter(rmse_threshold=0.01, distance_scales=(1.0,))
         result = fitter.fit(source_cloud, target_cloud)
         
         assert result.is_success is True
         assert mock_icp.call_count == 2
 
-    @patch('cascaded_fit.fitters.icp_fitter.o3d.pipelines.registration.registration_icp')
+    @patch('open3d.pipelines.registration.registration_icp')
+    def test_distance_schedule_coarse_to_fine(self, mock_icp, sample_point_clouds):
+        """Test ICP stages shrink the correspondence distance and chain transforms."""
+        source_cloud, target_cloud = sample_point_clouds
+
+        stage_results = []
+        for i in range(3):
+            stage = Mock()
+            stage.transformation = np.eye(4) * (i + 2)
+            stage.inlier_rmse = 0.1
+            stage.fitness = 0.5
+            stage_results.append(stage)
+        mock_icp.side_effect = stage_results
+
+        fitter = IcpFitter(rmse_threshold=0.01, max_correspondence_distance=10.0,
+                           distance_scales=(4.0, 2.0, 1.0))
+        result = fitter._execute_icp(source_cloud, target_cloud, np.eye(4))
+
+        distances = [c.kwargs['max_correspondence_distance'] for c in mock_icp.call_args_list]
+        assert distances == [40.0, 20.0, 10.0]
+        assert mock_icp.call_args_list[1].kwargs['init'] is stage_results[0].transformation
+        assert result.transformation is stage_results[2].transformation
+
+    @patch('open3d.pipelines.registration.registration_icp')
+    def test_distance_schedule_stops_when_converged(self, mock_icp, sample_point_clouds):
+        """Test remaining ICP stages are skipped once RMSE meets the threshold."""
+        source_cloud, target_cloud = sample_point_clouds
+
+        mock_result = Mock()
+        mock_result.transformation = np.eye(4)
+        mock_result.inlier_rmse = 0.001
+        mock_result.fitness = 0.99
+        mock_icp.return_value = mock_result
+
+        fitter = IcpFitter(rmse_threshold=0.01, distance_scales=(1.0, 0.5, 0.25))
+        result = fitter._execute_icp(source_cloud, target_cloud, np.eye(4))
+
+        assert result.is_success is True
+        assert mock_icp.call_count == 1
+
+    @patch('open3d.pipelines.registration.registration_icp')
+    def test_distance_schedule_ignores_coarse_rmse(self, mock_icp, sample_point_clouds):
+        """Test a coarse stage meeting the threshold does not end the schedule."""
+        source_cloud, target_cloud = sample_point_clouds
+
+        mock_result = Mock()
+        mock_result.transformation = np.eye(4)
+        mock_result.inlier_rmse = 0.001
+        mock_result.fitness = 0.99
+        mock_icp.return_value = mock_result
+
+        fitter = IcpFitter(rmse_threshold=0.01, max_iteration=30,
+                           distance_scales=(4.0, 2.0, 1.0))
+        fitter._execute_icp(source_cloud, target_cloud, np.eye(4))
+
+        assert mock_icp.call_count == 3
+        iterations = [c.kwargs['criteria'].max_iteration for c in mock_icp.call_args_list]
+        assert iterations == [10, 10, 30]
+
+    @patch('open3d.pipelines.registration.registration_icp')
     def test_fit_error_handling(self, mock_icp, sample_point_clouds):
         """Test fit error handling."""
         source_cloud, target_cloud = sample_point_clouds
@@ -146,7 +224,32 @@ class TestIcpFitterFit:
 class TestIcpFitterMethods:
     """Test IcpFitter helper methods."""
 
-    @patch('cascaded_fit.fitters.icp_fitter.o3d.pipelines.registration.registration_icp')
+    @patch('open3d.pipelines.registration.registration_icp')
+    @patch('open3d.t.pipelines.registration.icp')
+    @patch('open3d.t.geometry.PointCloud.from_legacy')
+    def test_prepared_target_uses_tensor_icp(self, mock_from_legacy, mock_tensor_icp,
+                                             mock_icp, sample_point_clouds):
+        """Test a prepared target is converted once and fitted with tensor ICP."""
+        source_cloud, target_cloud = sample_point_clouds
+
+        tensor_result = Mock()
+        tensor_result.transformation.numpy.return_value = np.eye(4)
+        tensor_result.inlier_rmse = 0.001
+        tensor_result.fitness = 0.99
+        mock_tensor_icp.return_value = tensor_result
+
+        fitter = IcpFitter(rmse_threshold=0.01)
+        fitter.prepare(target_cloud)
+        fitter._execute_icp(source_cloud, target_cloud, np.eye(4))
+        result = fitter._execute_icp(source_cloud, target_cloud, np.eye(4))
+
+        assert result.is_success is True
+        mock_icp.assert_not_called()
+        # One conversion for the target, one per run for the source
+        assert mock_from_legacy.call_count == 3
+        assert mock_tensor_icp.call_args[0][1] is fitter._prepared_target_t
+
+    @patch('open3d.pipelines.registration.registration_icp')
     def test_forward_icp(self, mock_icp, sample_point_clouds):
         """Test forward_icp method."""
         source_cloud, target_cloud = sample_point_clouds
@@ -165,7 +268,7 @@ class TestIcpFitterMethods:
         result = fitter.forward_icp()
         assert result.is_success is True
 
-    @patch('cascaded_fit.fitters.icp_fitter.o3d.pipelines.registration.registration_icp')
+    @patch('open3d.pipelines.registration.registration_icp')
     def test_reverse_icp(self, mock_icp, sample_point_clouds):
         """Test reverse_icp method."""
         source_cloud, target_cloud = sample_point_clouds
@@ -0,0 +1,103 @@
+"""Unit tests for MetricsCalculator."""
+
+import pytest
+import numpy as np
+from unittest.mock import patch
+from scipy.spatial import cKDTree
+from cascaded_fit.core.metrics import MetricsCalculator
+from cascaded_fit.core.neighbors import NearestNeighborIndex
+
+
+class TestComputeMetrics:
+    """Test MetricsCalculator.compute_metrics."""
+
+    def test_identical_clouds(self, simple_point_cloud, identity_transform):
+        """Test metrics are zero for identical clouds."""
+        metrics = MetricsCalculator.compute_metrics(
+            simple_point_cloud, simple_point_cloud, identity_transform
+        )
+
+        assert metrics['RMSE'] == pytest.approx(0.0)
+        assert metrics['Max Error'] == pytest.approx(0.0)
+        assert metrics['Transformation'] == identity_transform.tolist()
+
+    def test_transform_is_applied(self, simple_point_cloud, sample_translation):
+        """Test source is transformed before matching."""
+        target = simple_point_cloud + sample_translation[:3, 3]
+
+        metrics = MetricsCalculator.compute_metrics(
+            simple_point_cloud, target, sample_translation
+        )
+
+        assert metrics['RMSE'] == pytest.approx(0.0, abs=1e-9)
+
+    def test_prebuilt_tree_matches(self, simple_point_cloud, sample_rotation):
+        """Test passing a prebuilt tree gives the same result."""
+        target = simple_point_cloud + 0.5
+        tree = MetricsCalculator.build_tree(target)
+
+        expected = MetricsCalculator.compute_metrics(
+            simple_point_cloud, target, sample_rotation
+        )
+        metrics = MetricsCalculator.compute_metrics(
+            simple_point_cloud, target, sample_rotation, tree=tree
+        )
+
+        assert metrics == expected
+
+    def test_plain_kdtree_accepted(self, simple_point_cloud, sample_rotation):
+        """Test a caller-built cKDTree scores the same as the default index."""
+        target = simple_point_cloud + 0.5
+
+        expected = MetricsCalculator.compute_metrics(
+            simple_point_cloud, target, sample_rotation
+        )
+        metrics = MetricsCalculator.compute_metrics(
+            simple_point_cloud, target, sample_rotation, tree=cKDTree(target)
+        )
+
+        assert isinstance(MetricsCalculator.build_tree(target), NearestNeighborIndex)
+        assert metrics == pytest.approx(expected)
+
+    @pytest.mark.parametrize("n_points", [1, 2, 7, 10])
+    def test_order_statistics(self, n_points):
+        """Test median and max match NumPy for odd and even counts."""
+        rng = np.random.default_rng(7)
+        source = rng.random((n_points, 3))
+        target = rng.random((50, 3))
+
+        metrics = MetricsCalculator.compute_metrics(source, target, np.eye(4))
+
+        distances, _ = MetricsCalculator.build_tree(target).query(source)
+        assert metrics['Median Error'] == pytest.approx(np.median(distances))
+        assert metrics['Max Error'] == pytest.approx(distances.max())
+        assert metrics['Mean Error'] == pytest.approx(distances.mean())
+
+    def test_tiled_matches_single_tile(self, sample_rotation):
+        """Test splitting the source into tiles gives the same metrics."""
+        rng = np.random.default_rng(3)
+        source = rng.random((1000, 3))
+        target = rng.random((400, 3))
+
+        expected = MetricsCalculator.compute_metrics(source, target, sample_rotation)
+        with patch('cascaded_fit.core.metrics.METRICS_TILE_SIZE', 64):
+            metrics = MetricsCalculator.compute_metrics(source, target, sample_rotation)
+
+        assert metrics == pytest.approx(expected)
+
+    def test_large_source_is_subsampled(self):
+        """Test sampling estimates RMSE and exact mode queries every point."""
+        rng = np.random.default_rng(42)
+        source = rng.random((5000, 3))
+        target = source + 0.01
+        transform = np.eye(4)
+
+        exact = MetricsCalculator.compute_metrics(
+            source, target, transform, sample_size=500, exact_max_error=True
+        )
+        sampled = MetricsCalculator.compute_metrics(
+            source, target, transform, sample_size=500, exact_max_error=False
+        )
+
+        assert sampled['RMSE'] == pytest.approx(exact['RMSE'], rel=0.1)
+        assert sampled['Max Error'] <= exact['Max Error']
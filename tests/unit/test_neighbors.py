@@ -0,0 +1,64 @@
+"""Unit tests for NearestNeighborIndex."""
+
+import pytest
+import numpy as np
+from scipy.spatial import cKDTree
+from unittest.mock import patch
+from cascaded_fit.core.neighbors import NearestNeighborIndex
+from cascaded_fit.utils.exceptions import ConfigurationError
+
+
+class TestNearestNeighborIndex:
+    """Test NearestNeighborIndex class."""
+
+    def test_cpu_query(self, simple_point_cloud):
+        """Test CPU backend finds exact matches."""
+        index = NearestNeighborIndex(simple_point_cloud, backend='cpu')
+
+        distances, indices = index.query(simple_point_cloud)
+
+        assert index.backend == 'cpu'
+        np.testing.assert_allclose(distances, 0.0)
+        np.testing.assert_array_equal(indices, np.arange(len(simple_point_cloud)))
+
+    def test_cuda_falls_back_to_cpu(self, simple_point_cloud):
+        """Test CUDA backend falls back to the CPU tree when unavailable."""
+        with patch('cascaded_fit.core.neighbors._cuda_available', return_value=False):
+            index = NearestNeighborIndex(simple_point_cloud, backend='cuda')
+
+        assert index.backend == 'cpu'
+
+    def test_unknown_backend(self, simple_point_cloud):
+        """Test unknown backend is rejected."""
+        with pytest.raises(ConfigurationError, match="Unknown nearest-neighbour backend"):
+            NearestNeighborIndex(simple_point_cloud, backend='tpu')
+
+    def test_pykdtree_falls_back_to_cpu(self, simple_point_cloud):
+        """Test pykdtree backend falls back to the CPU tree when not installed."""
+        with patch('cascaded_fit.core.neighbors.PyKDTree', None):
+            index = NearestNeighborIndex(simple_point_cloud, backend='pykdtree')
+
+        assert index.backend == 'cpu'
+
+    def test_pykdtree_query(self, simple_point_cloud):
+        """Test pykdtree backend queries in the indexed dtype and honours the bound."""
+        class StubKDTree:
+            def __init__(self, data):
+                self.dtype = data.dtype
+                self._tree = cKDTree(data)
+
+            def query(self, points, k=1, distance_upper_bound=None):
+                assert points.dtype == self.dtype
+                distances, indices = self._tree.query(points, k=k)
+                return distances.astype(self.dtype), indices.astype(np.uint32)
+
+        target = simple_point_cloud.astype(np.float32)
+        with patch('cascaded_fit.core.neighbors.PyKDTree', StubKDTree):
+            index = NearestNeighborIndex(target, backend='pykdtree')
+        queries = np.vstack((simple_point_cloud[:5], [[1e4, 1e4, 1e4]]))
+
+        distances, indices = index.query(queries, distance_upper_bound=1.0)
+
+        assert index.backend == 'pykdtree'
+        np.testing.assert_array_equal(indices, [0, 1, 2, 3, 4, len(target)])
+        assert np.isinf(distances[-1])
@@ -40,6 +40,17 @@ def sample_csv_file(tmp_path):
     return str(csv_file)
 
 
+@pytest.fixture
+def sample_binary_ply_file(tmp_path):
+    """Create a sample binary little-endian xyz PLY file."""
+    ply_file = tmp_path / "binary.ply"
+    header = (b"ply\nformat binary_little_endian 1.0\nelement vertex 3\n"
+              b"property float x\nproperty float y\nproperty float z\nend_header\n")
+    points = np.array([[0, 0, 0], [1, 1, 1], [2, 2, 2]], dtype='<f4')
+    ply_file.write_bytes(header + points.tobytes())
+    return str(ply_file)
+
+
 class TestPointCloudReader:
     """Test PointCloudReader class."""
 
@@ -51,16 +62,16 @@ class TestPointCloudReader:
         assert len(point_cloud.points) == 3
 
     def test_read_csv_file(self, sample_csv_file):
-        """Test reading CSV file (converts to PLY)."""
+        """Test reading CSV file directly into a point cloud."""
         point_cloud = PointCloudReader.read_point_cloud_file(sample_csv_file)
         
         assert isinstance(point_cloud, o3d.geometry.PointCloud)
-        # CSV has 3 lines but newline counting may vary, check at least 2 points
-        assert len(point_cloud.points) >= 2
+        assert len(point_cloud.points) == 3
+        np.testing.assert_array_equal(np.asarray(point_cloud.points)[2], [2.0, 2.0, 2.0])
         
-        # Check that PLY file was created
+        # No intermediate PLY file is written
         ply_file = Path(sample_csv_file).with_suffix('.ply')
-        assert ply_file.exists()
+        assert not ply_file.exists()
 
     def test_read_unsupported_format(self, tmp_path):
         """Test reading unsupported file format."""
@@ -70,7 +81,7 @@ class TestPointCloudReader:
         with pytest.raises(PointCloudLoadError, match="Unsupported file format"):
             PointCloudReader.read_point_cloud_file(str(txt_file))
 
-    @patch('cascaded_fit.io.readers.o3d.io.read_point_cloud')
+    @patch('open3d.io.read_point_cloud')
     def test_read_empty_point_cloud(self, mock_read, tmp_path):
         """Test reading empty point cloud."""
         ply_file = tmp_path / "empty.ply"
@@ -82,7 +93,7 @@ class TestPointCloudReader:
         with pytest.raises(PointCloudLoadError, match="No points loaded"):
             PointCloudReader.read_point_cloud_file(str(ply_file))
 
-    @patch('cascaded_fit.io.readers.o3d.io.read_point_cloud')
+    @patch('open3d.io.read_point_cloud')
     def test_read_file_error(self, mock_read, tmp_path):
         """Test reading file with error."""
         ply_file = tmp_path / "error.ply"
@@ -93,18 +104,25 @@ class TestPointCloudReader:
         with pytest.raises(PointCloudLoadError):
             PointCloudReader.read_point_cloud_file(str(ply_file))
 
-    def test_convert_csv_to_ply(self, sample_csv_file, tmp_path):
-        """Test CSV to PLY conversion."""
-        ply_path = PointCloudReader._convert_csv_to_ply(sample_csv_file)
-        
-        assert Path(ply_path).exists()
-        assert ply_path.endswith('.ply')
-        
-        # Check PLY content
-        content = Path(ply_path).read_text()
-        assert 'ply' in content
-        assert 'element vertex' in content
-        assert '0.0 0.0 0.0' in content
+    def test_memmap_binary_xyz_ply(self, sample_binary_ply_file):
+        """Test binary xyz PLY is memory-mapped rather than parsed."""
+        points = PointCloudReader._memmap_xyz_ply(sample_binary_ply_file)
+
+        assert isinstance(points, np.memmap)
+        assert points.shape == (3, 3)
+        np.testing.assert_array_equal(points[1], [1.0, 1.0, 1.0])
+
+    def test_memmap_skips_ascii_ply(self, sample_ply_file):
+        """Test ASCII PLY falls back to the Open3D reader."""
+        assert PointCloudReader._memmap_xyz_ply(sample_ply_file) is None
+
+    @patch('open3d.io.read_point_cloud')
+    def test_read_binary_ply_uses_memmap(self, mock_read, sample_binary_ply_file):
+        """Test binary xyz PLY is loaded without Open3D's file reader."""
+        point_cloud = PointCloudReader.read_point_cloud_file(sample_binary_ply_file)
+
+        mock_read.assert_not_called()
+        assert len(point_cloud.points) == 3
 
     def test_load_ply_as_numpy(self, sample_ply_file):
         """Test loading PLY as numpy arrays."""
@@ -115,6 +133,27 @@ class TestPointCloudReader:
         # Normals may be None if not in file
         assert normals is None or isinstance(normals, np.ndarray)
 
+    @patch('open3d.io.read_point_cloud')
+    def test_load_binary_ply_via_memmap(self, mock_read, sample_binary_ply_file):
+        """Test binary xyz PLY is loaded without Open3D as a writable float64 array."""
+        points, normals = PointCloudReader.load_ply(sample_binary_ply_file)
+
+        mock_read.assert_not_called()
+        assert not isinstance(points, np.memmap)
+        assert points.dtype == np.float64
+        assert points.flags.writeable
+        assert points.shape == (3, 3)
+        assert normals is None
+
+    def test_cloud_from_array(self):
+        """Test building a point cloud straight from an array."""
+        points = np.array([[0, 0, 0], [1, 2, 3]], dtype=np.float32)
+
+        point_cloud = PointCloudReader.cloud_from_array(points)
+
+        assert isinstance(point_cloud, o3d.geometry.PointCloud)
+        np.testing.assert_array_equal(np.asarray(point_cloud.points), points)
+
     def test_align_cloud_sizes_equal(self):
         """Test align_cloud_sizes with equal sizes."""
         source = np.array([[1, 2, 3], [4, 5, 6]])
@@ -1,9 +1,16 @@
 """Unit tests for registration algorithms."""
 
+import threading
 import pytest
 import numpy as np
+from unittest.mock import patch
 from cascaded_fit.core.registration import RegistrationAlgorithms
-from cascaded_fit.utils.exceptions import RegistrationError, ConvergenceError
+from cascaded_fit.core.transformations import TransformationUtils
+from cascaded_fit.utils.exceptions import (
+    RegistrationError,
+    ConvergenceError,
+    RegistrationCancelledError
+)
 from cascaded_fit.utils.logger import Logger
 
 # Setup logger for tests
@@ -37,6 +44,20 @@ class TestPCARegistration:
         # Should recover the translation
         assert np.allclose(recovered_translation, translation, atol=1.0)
 
+    def test_translation_only_skips_rotation_solve(self, simple_point_cloud):
+        """Test PCA returns an exact translation without a rotation solve when aligned."""
+        translation = np.array([10, 20, 30])
+        target = simple_point_cloud + translation
+
+        with patch.object(RegistrationAlgorithms, '_rotation_from_covariance') as mock_solve:
+            transform = RegistrationAlgorithms.pca_registration(
+                simple_point_cloud, target
+            )
+
+        mock_solve.assert_not_called()
+        np.testing.assert_array_equal(transform[:3, :3], np.eye(3))
+        np.testing.assert_allclose(transform[:3, 3], translation)
+
     def test_rotation_recovery(self, simple_point_cloud, sample_rotation):
         """Test PCA can recover rotation."""
         # Apply rotation to create target
@@ -52,6 +73,30 @@ class TestPCARegistration:
         # Should be close to the original rotation
         assert np.allclose(transform[:3, :3], sample_rotation[:3, :3], atol=0.1)
 
+    def test_float32_far_from_origin(self, simple_point_cloud, sample_rotation):
+        """Test float32 clouds at large coordinates still give the right rotation."""
+        expected = sample_rotation.copy()
+        expected[:3, 3] = [5000.0, -3000.0, 1000.0]
+        source = (simple_point_cloud + 5000.0).astype(np.float32)
+        target = RegistrationAlgorithms.apply_transformation(
+            source.astype(np.float64), expected
+        ).astype(np.float32)
+
+        transform = RegistrationAlgorithms.pca_registration(source, target)
+
+        np.testing.assert_allclose(transform[:3, :3], expected[:3, :3], atol=1e-4)
+        np.testing.assert_allclose(transform[:3, 3], expected[:3, 3], atol=0.05)
+
+    def test_unequal_sizes(self, simple_point_cloud):
+        """Test PCA accepts clouds with different point counts."""
+        translation = np.array([1.0, 2.0, 3.0])
+        target = np.vstack((simple_point_cloud, simple_point_cloud[:10])) + translation
+
+        transform = RegistrationAlgorithms.pca_registration(simple_point_cloud, target)
+
+        np.testing.assert_allclose(transform[:3, :3], np.eye(3), atol=1e-6)
+        assert transform.shape == (4, 4)
+
 
 class TestICPRefinement:
     """Test ICP refinement algorithm."""
@@ -89,6 +134,156 @@ class TestICPRefinement:
         # Should have low error after refinement
         assert error < 0.5
 
+    def test_chunked_queries_match(self, simple_point_cloud):
+        """Test chunked nearest-neighbour queries give the same refinement."""
+        target = simple_point_cloud + np.array([1, 1, 1])
+
+        expected, _, expected_error = RegistrationAlgorithms.icp_refinement(
+            simple_point_cloud, target, np.eye(4), max_iterations=50
+        )
+        with patch('cascaded_fit.core.registration.ICP_QUERY_CHUNK_SIZE', 128):
+            transform, _, error = RegistrationAlgorithms.icp_refinement(
+                simple_point_cloud, target, np.eye(4), max_iterations=50
+            )
+
+        np.testing.assert_allclose(transform, expected, atol=1e-4)
+        assert error == pytest.approx(expected_error, abs=1e-4)
+
+    def test_converges_on_relative_stagnation(self, simple_point_cloud):
+        """Test ICP stops once the error plateaus even with zero tolerance."""
+        rng = np.random.default_rng(0)
+        target = simple_point_cloud + 0.5 + rng.normal(0, 0.01, simple_point_cloud.shape)
+
+        transform, iterations, error = RegistrationAlgorithms.icp_refinement(
+            simple_point_cloud,
+            target,
+            np.eye(4),
+            max_iterations=50,
+            tolerance=0.0
+        )
+
+        assert iterations < 50
+        assert error < 0.05
+
+    def test_target_index_reused(self, simple_point_cloud):
+        """Test repeated ICP on the same target array builds one index."""
+        from cascaded_fit.core import registration
+
+        target = simple_point_cloud + np.array([1, 1, 1])
+
+        with patch.object(registration, 'NearestNeighborIndex',
+                          wraps=registration.NearestNeighborIndex) as mock_index:
+            for _ in range(2):
+                RegistrationAlgorithms.icp_refinement(
+                    simple_point_cloud, target, np.eye(4), max_iterations=50
+                )
+
+        assert mock_index.call_count == 1
+
+    def test_target_cache_concurrent_use(self, simple_point_cloud):
+        """Test concurrent callers can prepare and evict targets safely."""
+        errors = []
+
+        def prepare_many():
+            try:
+                for _ in range(50):
+                    # Fresh arrays die straight away, firing the eviction callback
+                    RegistrationAlgorithms._prepare_target(simple_point_cloud[:100] + 1.0, 'cpu')
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=prepare_many) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+
+    def test_point_to_plane_recovers_transform(self):
+        """Test point-to-plane ICP recovers a rigid motion of a curved surface."""
+        grid = np.linspace(-10, 10, 40)
+        x, y = (axis.ravel() for axis in np.meshgrid(grid, grid))
+        target = np.column_stack((x, y, 0.05 * (x ** 2 + 2 * y ** 2) + 0.02 * x * y))
+        normals = np.column_stack((-(0.1 * x + 0.02 * y), -(0.2 * y + 0.02 * x), np.ones_like(x)))
+        normals /= np.linalg.norm(normals, axis=1, keepdims=True)
+
+        angle = 0.05
+        expected = np.eye(4)
+        expected[:3, :3] = [[np.cos(angle), -np.sin(angle), 0],
+                            [np.sin(angle), np.cos(angle), 0],
+                            [0, 0, 1]]
+        expected[:3, 3] = [0.3, -0.2, 0.1]
+        source = RegistrationAlgorithms.apply_transformation(
+            target, TransformationUtils.invert_rigid(expected)
+        )
+
+        transform, _, error = RegistrationAlgorithms.icp_refinement(
+            source, target, np.eye(4), max_iterations=100, target_normals=normals
+        )
+
+        np.testing.assert_allclose(transform, expected, atol=1e-5)
+        assert error < 1e-4
+
+    def test_mini_batch_warmup(self, simple_point_cloud):
+        """Test mini-batch warm-up hands a close transform to the full-cloud pass."""
+        expected = np.eye(4)
+        expected[:3, 3] = [1.0, 2.0, 3.0]
+        target = simple_point_cloud + expected[:3, 3]
+
+        with patch.object(RegistrationAlgorithms, '_stochastic_warmup',
+                          wraps=RegistrationAlgorithms._stochastic_warmup) as mock_warmup:
+            transform, _, error = RegistrationAlgorithms.icp_refinement(
+                simple_point_cloud, target, np.eye(4), max_iterations=100, batch_size=256
+            )
+
+        mock_warmup.assert_called_once()
+        assert mock_warmup.call_args[0][4] == 256
+        np.testing.assert_allclose(transform, expected, atol=1e-3)
+        assert error < 1e-3
+
+    def test_max_correspondence_distance_rejects_outliers(self, simple_point_cloud):
+        """Test source points with no target in range do not bias the fit."""
+        expected = np.eye(4)
+        expected[:3, 3] = [0.5, -0.3, 0.2]
+        target = simple_point_cloud + expected[:3, 3]
+        outliers = np.random.rand(200, 3) * 100 + 1000
+        source = np.vstack((simple_point_cloud, outliers))
+
+        transform, _, error = RegistrationAlgorithms.icp_refinement(
+            source, target, np.eye(4), max_correspondence_distance=5.0
+        )
+
+        np.testing.assert_allclose(transform, expected, atol=1e-4)
+        assert error < 1e-3
+
+    def test_max_correspondence_distance_without_matches(self, simple_point_cloud):
+        """Test ICP fails cleanly when no point has a target in range."""
+        with pytest.raises(RegistrationError, match="No correspondences"):
+            RegistrationAlgorithms.icp_refinement(
+                simple_point_cloud, simple_point_cloud + 500, np.eye(4),
+                max_correspondence_distance=1.0
+            )
+
+    def test_stop_event_cancels_refinement(self, simple_point_cloud):
+        """Test a set stop event abandons refinement before iterating."""
+        stop_event = threading.Event()
+        stop_event.set()
+
+        with pytest.raises(RegistrationCancelledError):
+            RegistrationAlgorithms.icp_refinement(
+                simple_point_cloud, simple_point_cloud + 1.0, np.eye(4),
+                stop_event=stop_event
+            )
+
+    def test_point_to_plane_rejects_mismatched_normals(self, simple_point_cloud):
+        """Test normals must match the target shape."""
+        with pytest.raises(RegistrationError, match="normals shape"):
+            RegistrationAlgorithms.icp_refinement(
+                simple_point_cloud, simple_point_cloud, np.eye(4),
+                target_normals=np.ones((10, 3))
+            )
+
     def test_max_iterations_exceeded(self, simple_point_cloud):
         """Test ICP raises error when max iterations exceeded."""
         # Create very different clouds
@@ -23,6 +23,19 @@ class TestRegistrationAlgorithmsAdditional:
         # Check translation component
         assert np.allclose(transform[:3, 3], [1, 1, 1])
 
+    def test_calculate_transformation_matrix_rotation(self, simple_point_cloud, sample_rotation):
+        """Test calculate_transformation_matrix recovers a rotation."""
+        transformed = RegistrationAlgorithms.apply_transformation(
+            simple_point_cloud, sample_rotation
+        )
+
+        transform = RegistrationAlgorithms.calculate_transformation_matrix(
+            simple_point_cloud, transformed
+        )
+
+        np.testing.assert_allclose(transform, sample_rotation, atol=1e-10)
+        assert np.linalg.det(transform[:3, :3]) == pytest.approx(1.0)
+
     def test_apply_transformation(self):
         """Test apply_transformation method."""
         points = np.array([[1, 0, 0], [0, 1, 0], [0, 0, 1]])
@@ -48,3 +61,14 @@ class TestRegistrationAlgorithmsAdditional:
         # [1,0,0] should become [0,1,0]
         np.testing.assert_allclose(transformed[0], [0, 1, 0], atol=1e-6)
 
+    def test_apply_transformation_in_place(self, simple_point_cloud, sample_rotation):
+        """Test apply_transformation can write into the input buffer."""
+        points = simple_point_cloud.astype(np.float64)
+        expected = RegistrationAlgorithms.apply_transformation(points, sample_rotation)
+
+        result = RegistrationAlgorithms.apply_transformation(
+            points, sample_rotation, out=points
+        )
+
+        assert result is points
+        np.testing.assert_allclose(points, expected)
@@ -1,6 +1,5 @@
 """Unit tests for TransformationUtils."""
 
-import pytest
 import numpy as np
 from cascaded_fit.core.transformations import TransformationUtils
 
@@ -56,6 +55,25 @@ class TestTransformationUtils:
         assert '1.0' in lines[0] or '1.00000' in lines[0]
         assert '2.0' in lines[0] or '2.00000' in lines[0]
 
+    def test_array_to_csv_string_matches_float_formatter(self):
+        """Test every value is formatted as float_to_max_decimals_string does."""
+        matrix = np.random.default_rng(0).normal(size=(4, 4))
+        result = TransformationUtils.array_to_csv_string(matrix)
+
+        expected = "\n".join(
+            ",".join(TransformationUtils.float_to_max_decimals_string(v) for v in row)
+            for row in matrix
+        )
+        assert result == expected
+
+    def test_array_to_csv_string_round_trip(self):
+        """Test array_to_csv_string preserves float64 values exactly."""
+        matrix = np.random.default_rng(0).random((4, 4))
+        result = TransformationUtils.array_to_csv_string(matrix)
+
+        parsed = np.array([[float(v) for v in line.split(',')] for line in result.split('\n')])
+        np.testing.assert_array_equal(parsed, matrix)
+
     def test_array_to_csv_string_no_trailing_newline(self):
         """Test array_to_csv_string doesn't have trailing newline."""
         matrix = np.array([[1.0, 2.0]])
@@ -63,3 +81,12 @@ class TestTransformationUtils:
         
         assert not result.endswith('\n')
 
+    def test_invert_rigid_matches_linalg_inv(self, sample_rotation):
+        """Test invert_rigid matches the general inverse for a rigid transform."""
+        transform = sample_rotation.copy()
+        transform[:3, 3] = [1.0, -2.0, 3.0]
+
+        inverse = TransformationUtils.invert_rigid(transform)
+
+        np.testing.assert_allclose(inverse, np.linalg.inv(transform), atol=1e-12)
+        np.testing.assert_allclose(inverse @ transform, np.eye(4), atol=1e-12)
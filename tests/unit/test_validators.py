@@ -60,6 +60,12 @@ class TestPointCloudValidator:
         with pytest.raises(PointCloudValidationError, match="NaN or Inf"):
             validator.validate(points_inf)
 
+    def test_large_finite_values(self):
+        """Test values whose sum overflows are still accepted as finite."""
+        validator = PointCloudValidator()
+        points_large = np.full((200, 3), 1e308)
+        validator.validate(points_large)  # Should not raise
+
     def test_all_zeros(self):
         """Test validation fails for all-zero point cloud."""
         validator = PointCloudValidator()
@@ -67,6 +73,10 @@ class TestPointCloudValidator:
         with pytest.raises(PointCloudValidationError, match="all zeros"):
             validator.validate(points_zeros)
 
+    def test_default_is_shared(self):
+        """Test default() reuses one validator for the loaded config."""
+        assert PointCloudValidator.default() is PointCloudValidator.default()
+
     def test_validate_pair(self, simple_point_cloud):
         """Test pair validation."""
         validator = PointCloudValidator()
@@ -85,6 +95,16 @@ class TestTransformationValidator:
         """Test validation of rotation matrix."""
         TransformationValidator.validate(sample_rotation)  # Should not raise
 
+    def test_repeated_transform_is_cached(self, sample_rotation):
+        """Test validating the same transform twice reuses the cached check."""
+        from cascaded_fit.core.validators import _check_transform
+
+        TransformationValidator.validate(sample_rotation)
+        hits = _check_transform.cache_info().hits
+        TransformationValidator.validate(sample_rotation.copy())
+
+        assert _check_transform.cache_info().hits == hits + 1
+
     def test_valid_translation(self, sample_translation):
         """Test validation of translation matrix."""
         TransformationValidator.validate(sample_translation)  # Should not raise